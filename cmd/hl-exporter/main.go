@@ -76,6 +76,8 @@ func main() {
 	infoEndpointURL := startCmd.String("info-endpoint-url", "", "URL the info probe POSTs to (default http://127.0.0.1:3001/info)")
 	enableExtendedMetrics := startCmd.Bool("extended-metrics", false, "Enable the extended monitor set (tcp_lz4, log lines, public IP, Tokio runtime, operator config, tmp dir)")
 	enablePerPeerMetrics := startCmd.Bool("per-peer-metrics", false, "Emit hl_p2p_peer_{last,first}_seen_seconds{ip} per known peer (cardinality bounded by the peer set's LRU cap + 24h TTL)")
+	forcePolling := startCmd.Bool("force-polling", false, "Poll log files for new lines instead of using inotify (for NODE_HOME on NFS/FUSE mounts)")
+	cpuProfile := startCmd.String("cpu-profile", "", "Write a CPU profile to this file until shutdown (input for `make pgo`)")
 
 	switch os.Args[1] {
 	case "start":
@@ -119,6 +121,7 @@ func main() {
 		InfoEndpointURL:       *infoEndpointURL,
 		EnableExtendedMetrics: *enableExtendedMetrics,
 		EnablePerPeerMetrics:  *enablePerPeerMetrics,
+		ForcePolling:          *forcePolling,
 	}
 
 	cfg := config.LoadConfig(flags)
@@ -141,6 +144,15 @@ func main() {
 	ctx, stop := signal.NotifyContext(context.Background(), syscall.SIGINT, syscall.SIGTERM)
 	defer stop()
 
+	if *cpuProfile != "" {
+		stopProfile, err := startCPUProfile(*cpuProfile)
+		if err != nil {
+			logger.Error("Failed to start CPU profile: %v", err)
+			os.Exit(1)
+		}
+		defer stopProfile()
+	}
+
 	// After loading config, before metrics initialization
 	validatorAddress, isValidator := monitors.GetValidatorStatus(cfg.NodeHome)
 
@@ -0,0 +1,30 @@
+package main
+
+import (
+	"os"
+	"runtime/pprof"
+
+	"github.com/validaoxyz/hyperliquid-exporter/internal/logger"
+)
+
+// startCPUProfile records a CPU profile to path until the returned stop
+// function runs at shutdown. A profile taken on a busy node is what
+// `make pgo` turns into cmd/hl-exporter/default.pgo, which `go build`
+// then uses to inline and lay out the log-parsing hot paths.
+func startCPUProfile(path string) (stop func(), err error) {
+	f, err := os.Create(path)
+	if err != nil {
+		return nil, err
+	}
+	if err := pprof.StartCPUProfile(f); err != nil {
+		f.Close()
+		return nil, err
+	}
+	logger.InfoComponent("system", "Writing CPU profile to %s until shutdown", path)
+	return func() {
+		pprof.StopCPUProfile()
+		if err := f.Close(); err != nil {
+			logger.Warning("Failed to write CPU profile %s: %v", path, err)
+		}
+	}, nil
+}
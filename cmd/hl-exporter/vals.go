@@ -254,7 +254,7 @@ func (c *csvCache) get() []byte {
 // runBackfill walks day directories ascending from `since`, decodes one
 // representative (highest-height) state file per day, and writes a daily
 // validator-count JSONL row. It avoids utils.GetLatestFile (which walks the
-// whole tree on every call) by listing day dirs directly.
+// whole tree) by listing day dirs directly.
 func runBackfill(stateDir, since, outPath string, sleep time.Duration) error {
 	start, err := time.Parse("2006-01-02", since)
 	if err != nil {
@@ -55,6 +55,10 @@ type Config struct {
 	// bounded by the peer set's LRU cap (256) + TTL (24h). Off by
 	// default for operators with tight per-target series limits.
 	EnablePerPeerMetrics bool
+	// ForcePolling makes the log tailers poll for new lines instead of
+	// waiting on inotify. Needed when NODE_HOME sits on NFS/FUSE or any
+	// other filesystem that doesn't deliver change notifications.
+	ForcePolling bool
 }
 
 type Flags struct {
@@ -80,6 +84,7 @@ type Flags struct {
 	InfoEndpointURL       string
 	EnableExtendedMetrics bool
 	EnablePerPeerMetrics  bool
+	ForcePolling          bool
 }
 
 // load env vars and returns a Config struct
@@ -136,6 +141,7 @@ func LoadConfig(flags *Flags) Config {
 		InfoEndpointURL:        flags.InfoEndpointURL,
 		EnableExtendedMetrics:  flags.EnableExtendedMetrics,
 		EnablePerPeerMetrics:   flags.EnablePerPeerMetrics,
+		ForcePolling:           flags.ForcePolling,
 	}
 
 	// override with flags if they're provided
@@ -3,6 +3,7 @@ package hyperliquidapi
 import (
 	"bytes"
 	"context"
+	"crypto/tls"
 	"encoding/json"
 	"fmt"
 	"io"
@@ -52,6 +53,29 @@ type APIRequest struct {
 	Type string `json:"type"`
 }
 
+// apiIdleConnTimeout keeps the API connection open across the validator
+// monitor's 5 minute poll, so polls normally skip TCP and TLS setup.
+const apiIdleConnTimeout = 6 * time.Minute
+
+// maxErrorBodySize caps how much of a non-200 body ends up in the error
+const maxErrorBodySize = 4 << 10
+
+// returns a transport dedicated to one API host. When the server has
+// dropped the idle connection anyway, the session cache lets the new one
+// resume TLS instead of doing a full handshake.
+func newAPITransport() *http.Transport {
+	t := http.DefaultTransport.(*http.Transport).Clone()
+	t.MaxIdleConns = 2
+	t.MaxIdleConnsPerHost = 2
+	t.IdleConnTimeout = apiIdleConnTimeout
+	t.TLSClientConfig = &tls.Config{
+		ClientSessionCache: tls.NewLRUClientSessionCache(4),
+	}
+	// a custom TLSClientConfig turns HTTP/2 off unless asked for
+	t.ForceAttemptHTTP2 = true
+	return t
+}
+
 // creates a new HL API resolver
 func NewResolver(chain string) *Resolver {
 	var baseURL string
@@ -63,7 +87,8 @@ func NewResolver(chain string) *Resolver {
 
 	return &Resolver{
 		client: &http.Client{
-			Timeout: 30 * time.Second,
+			Timeout:   30 * time.Second,
+			Transport: newAPITransport(),
 		},
 		baseURL: baseURL,
 		chain:   chain,
@@ -133,7 +158,7 @@ func (r *Resolver) GetSignerToValidatorMapping() map[string]string {
 	defer r.mu.RUnlock()
 
 	// Return a copy to prevent external modifications
-	mapping := make(map[string]string)
+	mapping := make(map[string]string, len(r.validatorCache.signerToValidator))
 	for k, v := range r.validatorCache.signerToValidator {
 		mapping[k] = v
 	}
@@ -158,8 +183,8 @@ func (r *Resolver) updateValidatorCache(summaries []ValidatorSummary) {
 	defer r.mu.Unlock()
 
 	// clear and rebuild maps
-	r.validatorCache.signerToValidator = make(map[string]string)
-	r.validatorCache.validatorInfo = make(map[string]*ValidatorSummary)
+	r.validatorCache.signerToValidator = make(map[string]string, len(summaries))
+	r.validatorCache.validatorInfo = make(map[string]*ValidatorSummary, len(summaries))
 
 	for i := range summaries {
 		summary := &summaries[i]
@@ -182,15 +207,8 @@ func (r *Resolver) makeAPICall(ctx context.Context, endpoint string, request int
 	}
 
 	url := r.baseURL + endpoint
-	req, err := http.NewRequestWithContext(ctx, "POST", url, bytes.NewBuffer(payload))
-	if err != nil {
-		return fmt.Errorf("failed to create request: %w", err)
-	}
-
-	req.Header.Set("Content-Type", "application/json")
 
 	// retry with exponential backoff
-	var resp *http.Response
 	var lastErr error
 
 	for attempt := 0; attempt < 3; attempt++ {
@@ -204,28 +222,35 @@ func (r *Resolver) makeAPICall(ctx context.Context, endpoint string, request int
 			}
 		}
 
-		resp, err = r.client.Do(req)
+		// a request body can only be sent once, so build a fresh request
+		// for every attempt
+		req, err := http.NewRequestWithContext(ctx, "POST", url, bytes.NewReader(payload))
+		if err != nil {
+			return fmt.Errorf("failed to create request: %w", err)
+		}
+		req.Header.Set("Content-Type", "application/json")
+
+		resp, err := r.client.Do(req)
 		if err != nil {
 			lastErr = fmt.Errorf("request failed: %w", err)
 			continue
 		}
 
-		defer resp.Body.Close()
-
 		if resp.StatusCode != http.StatusOK {
-			body, _ := io.ReadAll(resp.Body)
+			body, _ := io.ReadAll(io.LimitReader(resp.Body, maxErrorBodySize))
+			resp.Body.Close()
 			lastErr = fmt.Errorf("API returned status %d: %s", resp.StatusCode, string(body))
 			continue
 		}
 
-		// success,decode response
-		body, err := io.ReadAll(resp.Body)
+		// success, decode straight from the body rather than buffering the
+		// whole response first; then drain what the decoder left (trailing
+		// newline) so the connection goes back to the pool
+		err = json.NewDecoder(resp.Body).Decode(response)
+		io.Copy(io.Discard, resp.Body)
+		resp.Body.Close()
 		if err != nil {
-			return fmt.Errorf("failed to read response: %w", err)
-		}
-
-		if err := json.Unmarshal(body, response); err != nil {
-			return fmt.Errorf("failed to unmarshal response: %w", err)
+			return fmt.Errorf("failed to decode response: %w", err)
 		}
 
 		return nil
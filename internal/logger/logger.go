@@ -80,6 +80,13 @@ func SetLogLevel(level string) error {
 	return nil
 }
 
+// DebugEnabled reports whether debug messages are being written. Per-line
+// parsers check it before building arguments (time formatting, interface
+// boxing) that DebugComponent would otherwise throw away.
+func DebugEnabled() bool {
+	return currentLevel <= DEBUG
+}
+
 func SetColorsEnabled(enabled bool) {
 	enableColors = enabled
 }
@@ -1,7 +1,6 @@
 package metrics
 
 import (
-	"regexp"
 	"strings"
 	"sync"
 )
@@ -10,9 +9,6 @@ var (
 	// stores mappings from truncated addresses to full addresses
 	addressCache   = make(map[string]string)
 	addressCacheMu sync.RWMutex
-
-	// matches addresses in format "0x1234..5678"
-	truncatedAddressPattern = regexp.MustCompile(`^0x[a-fA-F0-9]{4,6}\.\.[a-fA-F0-9]{4}$`)
 )
 
 // stores both full address and its truncated version in the cache
@@ -28,8 +24,12 @@ func RegisterFullAddress(fullAddress string) {
 	truncated := truncateAddress(fullAddress)
 
 	addressCacheMu.Lock()
+	changed := addressCache[truncated] != fullAddress
 	addressCache[truncated] = fullAddress
 	addressCacheMu.Unlock()
+	if changed {
+		labelGeneration.Add(1)
+	}
 }
 
 // returns full address if input is truncated, otherwise returns input as is
@@ -58,9 +58,30 @@ func ExpandAddress(address string) string {
 	return address
 }
 
-// check if an address matches truncated pattern
+// check if an address matches truncated pattern "0x1234..5678"
+// (4-6 hex digits before the dots, 4 after). Hand-rolled rather than a
+// regexp: it runs on consensus-log addresses, several per line.
 func IsAddressTruncated(address string) bool {
-	return truncatedAddressPattern.MatchString(address)
+	n := len(address)
+	if n < 12 || n > 14 || address[0] != '0' || address[1] != 'x' || address[n-6] != '.' || address[n-5] != '.' {
+		return false
+	}
+	return isHexString(address[2:n-6]) && isHexString(address[n-4:])
+}
+
+// check if an address is a full 0x-prefixed 20-byte hex address
+func isFullAddress(address string) bool {
+	return len(address) == 42 && address[0] == '0' && address[1] == 'x' && isHexString(address[2:])
+}
+
+func isHexString(s string) bool {
+	for i := 0; i < len(s); i++ {
+		c := s[i]
+		if !('0' <= c && c <= '9' || 'a' <= c && c <= 'f' || 'A' <= c && c <= 'F') {
+			return false
+		}
+	}
+	return true
 }
 
 // creates truncated version of a full address
@@ -83,4 +104,5 @@ func ClearAddressCache() {
 	addressCacheMu.Lock()
 	addressCache = make(map[string]string)
 	addressCacheMu.Unlock()
+	labelGeneration.Add(1)
 }
@@ -0,0 +1,42 @@
+package metrics
+
+import "testing"
+
+func TestIsAddressTruncated(t *testing.T) {
+	cases := map[string]bool{
+		"0x1234..5678":   true,
+		"0xabcdef..1234": true,
+		"0xABCD..ef12":   true,
+		"0x123..5678":    false, // too few leading digits
+		"0x1234567..568": false,
+		"0x1234..567":    false,
+		"0x1234.5678":    false,
+		"0X1234..5678":   false,
+		"0x1234..56g8":   false,
+		"":               false,
+		"0x12345678901234567890123456789012345678ab": false,
+	}
+	for addr, want := range cases {
+		if got := IsAddressTruncated(addr); got != want {
+			t.Errorf("IsAddressTruncated(%q) = %v, want %v", addr, got, want)
+		}
+	}
+}
+
+func TestIsFullAddress(t *testing.T) {
+	cases := map[string]bool{
+		"0x12345678901234567890123456789012345678ab":  true,
+		"0x12345678901234567890123456789012345678AB":  true,
+		"0x12345678901234567890123456789012345678a":   false,
+		"0x12345678901234567890123456789012345678abc": false,
+		"0x12345678901234567890123456789012345678zz":  false,
+		"1x12345678901234567890123456789012345678ab":  false,
+		"0x1234..5678": false,
+		"":             false,
+	}
+	for addr, want := range cases {
+		if got := isFullAddress(addr); got != want {
+			t.Errorf("isFullAddress(%q) = %v, want %v", addr, got, want)
+		}
+	}
+}
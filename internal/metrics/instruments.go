@@ -9,8 +9,9 @@ import (
 // metric instruments for hl_exporter
 var (
 	// counters consensus
-	HLConsensusProposerCounter api.Int64Counter
-	HLTimeoutRoundsCounter     api.Int64Counter
+	HLConsensusProposerCounter        api.Int64Counter
+	HLConsensusProposerUnknownCounter api.Int64Counter
+	HLTimeoutRoundsCounter            api.Int64Counter
 
 	// counters Core
 	HLCoreTxCounter              api.Int64Counter
@@ -162,6 +163,14 @@ func createInstruments() error {
 		return fmt.Errorf("failed to create consensus proposer counter: %w", err)
 	}
 
+	HLConsensusProposerUnknownCounter, err = meter.Int64Counter(
+		"hl_consensus_proposer_unknown_total",
+		api.WithDescription("Blocks whose proposer did not match a known signer or validator and were counted under proposer labels \"unknown\""),
+	)
+	if err != nil {
+		return fmt.Errorf("failed to create consensus unknown proposer counter: %w", err)
+	}
+
 	HLCoreBlockHeightGauge, err = meter.Int64ObservableGauge(
 		"hl_core_block_height",
 		api.WithDescription("Current block height of the chain"),
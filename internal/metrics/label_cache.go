@@ -0,0 +1,133 @@
+package metrics
+
+import (
+	"sync"
+	"sync/atomic"
+
+	"go.opentelemetry.io/otel/attribute"
+	api "go.opentelemetry.io/otel/metric"
+)
+
+// maxCachedLabelSets bounds the label caches; past it they are reset
+// rather than evicted one by one, like cleanupLabeledValues does.
+const maxCachedLabelSets = 5000
+
+var (
+	// labelGeneration is bumped after a signer, validator-info or
+	// truncated-address mapping changes value. Label sets cached under an
+	// older generation are rebuilt on their next lookup.
+	labelGeneration atomic.Uint64
+
+	labelCacheMu        sync.RWMutex
+	labelCacheGen       uint64
+	validatorLabelCache = make(map[string][]attribute.KeyValue)
+	proposerAttrCache   = make(map[string]proposerAttrs)
+
+	// common labels + state_type, per block-time stream (fast, slow)
+	stateTypeAttrMu    sync.RWMutex
+	stateTypeAttrCache = make(map[string]api.MeasurementOption)
+
+	// shared by every proposer isKnownProposer rejects
+	unknownProposerAttrs = api.WithAttributes(
+		attribute.String("validator", "unknown"),
+		attribute.String("signer", "unknown"),
+		attribute.String("name", "unknown"),
+	)
+)
+
+// returns cached validator/signer/name labels for an address, building
+// them with buildValidatorLabels on a miss. The slice is shared and must
+// not be modified.
+func getValidatorLabels(addressInput string) []attribute.KeyValue {
+	gen := labelGeneration.Load()
+	labelCacheMu.RLock()
+	if labelCacheGen == gen {
+		if labels, ok := validatorLabelCache[addressInput]; ok {
+			labelCacheMu.RUnlock()
+			return labels
+		}
+	}
+	labelCacheMu.RUnlock()
+
+	labels := buildValidatorLabels(addressInput)
+
+	labelCacheMu.Lock()
+	if syncLabelCacheLocked(gen) {
+		validatorLabelCache[addressInput] = labels
+	}
+	labelCacheMu.Unlock()
+	return labels
+}
+
+// proposerAttrs is the proposer counter's attribute option for one
+// proposer, and whether isKnownProposer accepted it (unknown proposers all
+// share unknownProposerAttrs).
+type proposerAttrs struct {
+	opt   api.AddOption
+	known bool
+}
+
+// returns the cached counter attributes for a proposer. The known/unknown
+// decision depends on the same mappings as the labels, so it is cached
+// with them and recomputed after a mapping change.
+func getProposerAttrs(proposer string) proposerAttrs {
+	gen := labelGeneration.Load()
+	labelCacheMu.RLock()
+	if labelCacheGen == gen {
+		if attrs, ok := proposerAttrCache[proposer]; ok {
+			labelCacheMu.RUnlock()
+			return attrs
+		}
+	}
+	labelCacheMu.RUnlock()
+
+	attrs := proposerAttrs{opt: unknownProposerAttrs}
+	if isKnownProposer(proposer) {
+		attrs = proposerAttrs{opt: api.WithAttributes(buildProposerLabels(proposer)...), known: true}
+	}
+
+	labelCacheMu.Lock()
+	if syncLabelCacheLocked(gen) {
+		proposerAttrCache[proposer] = attrs
+	}
+	labelCacheMu.Unlock()
+	return attrs
+}
+
+// syncLabelCacheLocked resets the caches when gen is newer than their
+// contents or they grew past maxCachedLabelSets. It reports whether a
+// value built under gen may be stored.
+func syncLabelCacheLocked(gen uint64) bool {
+	if gen < labelCacheGen {
+		// built before a mapping change another caller already saw
+		return false
+	}
+	if gen > labelCacheGen || len(validatorLabelCache)+len(proposerAttrCache) >= maxCachedLabelSets {
+		validatorLabelCache = make(map[string][]attribute.KeyValue)
+		proposerAttrCache = make(map[string]proposerAttrs)
+		labelCacheGen = gen
+	}
+	return true
+}
+
+// returns the common labels plus state_type as one option, built once per
+// state type; the block-time histograms record with it on every line.
+func getStateTypeAttrs(stateType string) api.MeasurementOption {
+	stateTypeAttrMu.RLock()
+	opt, ok := stateTypeAttrCache[stateType]
+	stateTypeAttrMu.RUnlock()
+	if ok {
+		return opt
+	}
+
+	commonLabels := getCommonLabels()
+	labels := make([]attribute.KeyValue, 0, len(commonLabels)+1)
+	labels = append(labels, commonLabels...)
+	labels = append(labels, attribute.String("state_type", stateType))
+	opt = api.WithAttributes(labels...)
+
+	stateTypeAttrMu.Lock()
+	stateTypeAttrCache[stateType] = opt
+	stateTypeAttrMu.Unlock()
+	return opt
+}
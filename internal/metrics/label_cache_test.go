@@ -0,0 +1,181 @@
+package metrics
+
+import (
+	"context"
+	"fmt"
+	"testing"
+
+	sdkmetric "go.opentelemetry.io/otel/sdk/metric"
+	"go.opentelemetry.io/otel/sdk/metric/metricdata"
+)
+
+// resetLabelState gives a test empty signer, validator-info and address
+// mappings and drops every cached label set, before and after it runs.
+func resetLabelState(t *testing.T) {
+	t.Helper()
+	reset := func() {
+		signerMap, validatorInfoCache = nil, nil
+		addressCacheMu.Lock()
+		addressCache = make(map[string]string)
+		addressCacheMu.Unlock()
+		labelGeneration.Add(1)
+	}
+	reset()
+	t.Cleanup(reset)
+}
+
+// useManualProposerCounters points the proposer counters at a manual
+// reader for the duration of the test.
+func useManualProposerCounters(t *testing.T) *sdkmetric.ManualReader {
+	t.Helper()
+	reader := sdkmetric.NewManualReader()
+	meter := sdkmetric.NewMeterProvider(sdkmetric.WithReader(reader)).Meter("test")
+
+	prevCounter, prevUnknown := HLConsensusProposerCounter, HLConsensusProposerUnknownCounter
+	t.Cleanup(func() {
+		HLConsensusProposerCounter, HLConsensusProposerUnknownCounter = prevCounter, prevUnknown
+	})
+
+	var err error
+	if HLConsensusProposerCounter, err = meter.Int64Counter("hl_consensus_proposer_count_total"); err != nil {
+		t.Fatal(err)
+	}
+	if HLConsensusProposerUnknownCounter, err = meter.Int64Counter("hl_consensus_proposer_unknown_total"); err != nil {
+		t.Fatal(err)
+	}
+	return reader
+}
+
+// collectProposerCounts returns the proposer counter keyed by its
+// {validator, signer} labels, and the unknown-proposer total.
+func collectProposerCounts(t *testing.T, reader *sdkmetric.ManualReader) (map[[2]string]int64, int64) {
+	t.Helper()
+	var rm metricdata.ResourceMetrics
+	if err := reader.Collect(context.Background(), &rm); err != nil {
+		t.Fatal(err)
+	}
+
+	counts := make(map[[2]string]int64)
+	var unknown int64
+	for _, sm := range rm.ScopeMetrics {
+		for _, m := range sm.Metrics {
+			sum, ok := m.Data.(metricdata.Sum[int64])
+			if !ok {
+				continue
+			}
+			for _, dp := range sum.DataPoints {
+				switch m.Name {
+				case "hl_consensus_proposer_count_total":
+					validator, _ := dp.Attributes.Value("validator")
+					signer, _ := dp.Attributes.Value("signer")
+					counts[[2]string{validator.AsString(), signer.AsString()}] += dp.Value
+				case "hl_consensus_proposer_unknown_total":
+					unknown += dp.Value
+				}
+			}
+		}
+	}
+	return counts, unknown
+}
+
+func TestIncrementProposerCounterBucketsUnknown(t *testing.T) {
+	resetLabelState(t)
+	reader := useManualProposerCounters(t)
+
+	const (
+		signer    = "0x1111111111111111111111111111111111111111"
+		validator = "0x2222222222222222222222222222222222222222"
+		stranger  = "0x3333333333333333333333333333333333333333"
+	)
+
+	// before any mapping is loaded a well-formed address gets its own
+	// series; anything else is still unknown
+	IncrementProposerCounter(stranger)
+	IncrementProposerCounter("not-an-address")
+
+	RegisterSignerMapping(signer, validator)
+	RegisterValidatorInfo(validator, signer, "alice")
+	IncrementProposerCounter(signer)    // known signer
+	IncrementProposerCounter(validator) // known validator
+	IncrementProposerCounter(stranger)  // unknown now that mappings exist
+
+	counts, unknown := collectProposerCounts(t, reader)
+	want := map[[2]string]int64{
+		{stranger, stranger}:   1,
+		{"unknown", "unknown"}: 2,
+		{validator, signer}:    1,
+		{validator, validator}: 1,
+	}
+	if len(counts) != len(want) {
+		t.Errorf("series = %v, want %v", counts, want)
+	}
+	for k, v := range want {
+		if counts[k] != v {
+			t.Errorf("proposer_count_total%v = %d, want %d", k, counts[k], v)
+		}
+	}
+	if unknown != 2 {
+		t.Errorf("proposer_unknown_total = %d, want 2", unknown)
+	}
+}
+
+func TestValidatorLabelsRebuiltOnMappingChange(t *testing.T) {
+	resetLabelState(t)
+
+	const (
+		signer    = "0x1111111111111111111111111111111111111111"
+		validator = "0x2222222222222222222222222222222222222222"
+		truncated = "0x1111..1111"
+	)
+	check := func(step, wantValidator, wantSigner, wantName string) {
+		t.Helper()
+		got := map[string]string{}
+		for _, kv := range getValidatorLabels(truncated) {
+			got[string(kv.Key)] = kv.Value.AsString()
+		}
+		want := map[string]string{"validator": wantValidator, "signer": wantSigner, "name": wantName}
+		for k, v := range want {
+			if got[k] != v {
+				t.Errorf("%s: %s = %q, want %q", step, k, got[k], v)
+			}
+		}
+	}
+
+	check("no mappings", truncated, truncated, "unknown")
+	RegisterFullAddress(signer)
+	check("after RegisterFullAddress", signer, signer, "unknown")
+	RegisterSignerMapping(signer, validator)
+	check("after RegisterSignerMapping", validator, signer, "unknown")
+	RegisterValidatorInfo(validator, signer, "alice")
+	check("after RegisterValidatorInfo", validator, signer, "alice")
+
+	// re-registering the same values keeps the cache
+	gen := labelGeneration.Load()
+	RegisterFullAddress(signer)
+	RegisterSignerMapping(signer, validator)
+	RegisterValidatorInfo(validator, signer, "alice")
+	if labelGeneration.Load() != gen {
+		t.Error("unchanged mappings invalidated the label cache")
+	}
+}
+
+func TestLabelCacheResetsAtLimit(t *testing.T) {
+	resetLabelState(t)
+	cached := func() int {
+		labelCacheMu.RLock()
+		defer labelCacheMu.RUnlock()
+		return len(validatorLabelCache) + len(proposerAttrCache)
+	}
+
+	for i := 0; i < maxCachedLabelSets; i++ {
+		getValidatorLabels(fmt.Sprintf("validator-%d", i))
+	}
+	if n := cached(); n != maxCachedLabelSets {
+		t.Fatalf("cached %d label sets, want %d", n, maxCachedLabelSets)
+	}
+
+	getValidatorLabels("one-more")
+	if n := cached(); n != 1 {
+		t.Errorf("cached %d label sets after the limit, want 1", n)
+	}
+}
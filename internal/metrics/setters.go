@@ -118,6 +118,31 @@ func getOrCreateOpAttrs(actionType, category string) []api.AddOption {
 }
 
 func IncrementProposerCounter(proposer string) {
+	attrs := getProposerAttrs(proposer)
+	HLConsensusProposerCounter.Add(sharedCtx, 1, attrs.opt)
+	if !attrs.known {
+		// a malformed or unmapped proposer must not mint a new series
+		HLConsensusProposerUnknownCounter.Add(sharedCtx, 1)
+	}
+}
+
+// reports whether proposer is a signer or validator address we have a
+// mapping for. Until the validator set has been fetched nothing is mapped,
+// so any well-formed address is accepted rather than bucketing every block
+// seen at startup.
+func isKnownProposer(proposer string) bool {
+	p := strings.ToLower(proposer)
+	if _, ok := GetValidatorForSigner(p); ok {
+		return true
+	}
+	if _, _, ok := GetValidatorInfo(p); ok {
+		return true
+	}
+	return signerMap.Len() == 0 && isFullAddress(p)
+}
+
+// returns validator, signer and name labels for a proposer from replica_cmds
+func buildProposerLabels(proposer string) []attribute.KeyValue {
 	// the proposer field from replica_cmds contains the signer address
 	signer := proposer
 	validator := signer // default to signer if no mapping
@@ -137,23 +162,16 @@ func IncrementProposerCounter(proposer string) {
 		name = GetValidatorName(strings.ToLower(validator))
 	}
 
-	// now register metric atomically
-	metricsMutex.Lock()
-	defer metricsMutex.Unlock()
-
-	ctx := context.Background()
 	// always set the name label so the series shape stays stable; use the
 	// "unknown" sentinel (as getValidatorLabels does) when we have no moniker
 	if name == "" {
 		name = "unknown"
 	}
-	labels := []attribute.KeyValue{
+	return []attribute.KeyValue{
 		attribute.String("validator", validator),
 		attribute.String("signer", signer),
 		attribute.String("name", name),
 	}
-
-	HLConsensusProposerCounter.Add(ctx, 1, api.WithAttributes(labels...))
 }
 
 func SetBlockHeight(height int64) {
@@ -172,20 +190,12 @@ func RecordBlockTime(duration float64) {
 }
 
 func RecordBlockTimeWithLabel(duration float64, stateType string) {
-	ctx := context.Background()
-	commonLabels := getCommonLabels()
-
-	// add state_type label to common labels
-	labels := append(commonLabels, attribute.String("state_type", stateType))
-
 	if HLCoreBlockTimeHistogram != nil {
-		HLCoreBlockTimeHistogram.Record(ctx, duration, api.WithAttributes(labels...))
+		HLCoreBlockTimeHistogram.Record(sharedCtx, duration, getStateTypeAttrs(stateType))
 	}
 }
 
 func RecordApplyDuration(duration float64) {
-	metricsMutex.Lock()
-	defer metricsMutex.Unlock()
 	ctx := context.Background()
 	commonLabels := getCommonLabels()
 
@@ -195,16 +205,8 @@ func RecordApplyDuration(duration float64) {
 }
 
 func RecordApplyDurationWithLabel(duration float64, stateType string) {
-	metricsMutex.Lock()
-	defer metricsMutex.Unlock()
-	ctx := context.Background()
-	commonLabels := getCommonLabels()
-
-	// add state_type label to common labels
-	labels := append(commonLabels, attribute.String("state_type", stateType))
-
 	if HLMetalApplyDurationHistogram != nil {
-		HLMetalApplyDurationHistogram.Record(ctx, duration, api.WithAttributes(labels...))
+		HLMetalApplyDurationHistogram.Record(sharedCtx, duration, getStateTypeAttrs(stateType))
 	}
 }
 
@@ -728,7 +730,7 @@ func SetCurrentConsensusRound(round int64) {
 }
 
 // returns expanded validator, signer, and name labels for a validator or signer address
-func getValidatorLabels(addressInput string) []attribute.KeyValue {
+func buildValidatorLabels(addressInput string) []attribute.KeyValue {
 	// first expand the address if it's truncated
 	addressInput = ExpandAddress(addressInput)
 
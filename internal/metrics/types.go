@@ -55,7 +55,12 @@ func RegisterSignerMapping(signer, validator string) {
 	if signerMap == nil {
 		initSignerMap()
 	}
+	old, exists := signerMap.Get(signer)
 	signerMap.Set(signer, validator)
+	// cached label sets derived from the old mapping are now stale
+	if !exists || old.(string) != validator {
+		labelGeneration.Add(1)
+	}
 }
 
 // get val addr for a signer
@@ -75,10 +80,15 @@ func RegisterValidatorInfo(validator, signer, name string) {
 	if validatorInfoCache == nil {
 		initValidatorInfoCache()
 	}
-	validatorInfoCache.Set(validator, ValidatorInfo{
+	info := ValidatorInfo{
 		Signer: signer,
 		Name:   name,
-	})
+	}
+	old, exists := validatorInfoCache.Get(validator)
+	validatorInfoCache.Set(validator, info)
+	if !exists || old.(ValidatorInfo) != info {
+		labelGeneration.Add(1)
+	}
 }
 
 // get signer and name for a val addr
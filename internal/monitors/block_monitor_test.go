@@ -0,0 +1,61 @@
+package monitors
+
+import (
+	"encoding/json"
+	"strings"
+	"testing"
+)
+
+func TestDecodeBlockTimeLine(t *testing.T) {
+	line := []byte(`{"height":612345678,"block_time":"2026-05-25T11:12:20.656667039","apply_duration":0.004512,"begin_block_wall_time":"2026-05-25T11:12:20.701002113"}`)
+	data, err := decodeBlockTimeLine(line)
+	if err != nil {
+		t.Fatalf("decode failed: %v", err)
+	}
+	if *data.Height != 612345678 {
+		t.Errorf("height = %v, want 612345678", *data.Height)
+	}
+	if *data.BlockTime != "2026-05-25T11:12:20.656667039" {
+		t.Errorf("block_time = %q", *data.BlockTime)
+	}
+	if *data.ApplyDuration != 0.004512 {
+		t.Errorf("apply_duration = %v, want 0.004512", *data.ApplyDuration)
+	}
+	if data.BeginBlockWallTime != "2026-05-25T11:12:20.701002113" {
+		t.Errorf("begin_block_wall_time = %q", data.BeginBlockWallTime)
+	}
+
+	// legacy lines have no begin_block_wall_time
+	if _, err := decodeBlockTimeLine([]byte(`{"height":1,"block_time":"2025-01-01T00:00:00","apply_duration":0}`)); err != nil {
+		t.Errorf("legacy line: %v", err)
+	}
+}
+
+func TestDecodeBlockTimeLineMissingFields(t *testing.T) {
+	cases := map[string]string{
+		`{"block_time":"2025-01-01T00:00:00","apply_duration":0.1}`: "height",
+		`{"height":1,"apply_duration":0.1}`:                         "block time",
+		`{"height":1,"block_time":"2025-01-01T00:00:00"}`:           "apply duration",
+		`{"height":1,"block_time":"2025-01-01T0`:                    "parsing",
+	}
+	for line, want := range cases {
+		_, err := decodeBlockTimeLine([]byte(line))
+		if err == nil || !strings.Contains(err.Error(), want) {
+			t.Errorf("%s: got %v, want error mentioning %q", line, err, want)
+		}
+	}
+}
+
+func TestProposalLineDecode(t *testing.T) {
+	line := []byte(`{"abci_block":{"time":"2026-05-25T11:12:20.656","round":1,"parent_round":0,"hardfork":{"version":1,"round":0},"proposer":"0xabc0000000000000000000000000000000000001","signed_action_bundles":[["0x01",{"signed_actions":[{"action":{"type":"order"}}]}]]},"resps":{"Full":[]}}`)
+	var data proposalLine
+	if err := json.Unmarshal(line, &data); err != nil {
+		t.Fatalf("decode failed: %v", err)
+	}
+	if data.ABCIBlock == nil || data.ABCIBlock.Proposer == nil {
+		t.Fatal("proposer not decoded")
+	}
+	if got := *data.ABCIBlock.Proposer; got != "0xabc0000000000000000000000000000000000001" {
+		t.Errorf("proposer = %q", got)
+	}
+}
@@ -1,13 +1,11 @@
 package monitors
 
 import (
-	"bufio"
 	"bytes"
 	"context"
 	"encoding/json"
 	"errors"
 	"fmt"
-	"io"
 	"os"
 	"path/filepath"
 	"strings"
@@ -18,7 +16,6 @@ import (
 	"github.com/validaoxyz/hyperliquid-exporter/internal/config"
 	"github.com/validaoxyz/hyperliquid-exporter/internal/logger"
 	"github.com/validaoxyz/hyperliquid-exporter/internal/metrics"
-	"github.com/validaoxyz/hyperliquid-exporter/internal/utils"
 )
 
 // stores QC participation data for sliding window calc
@@ -27,6 +24,12 @@ type qcWindowEntry struct {
 	signers   []string
 }
 
+// connectivityPair is a validator and a peer it reports as disconnected
+type connectivityPair struct {
+	validator string
+	peer      string
+}
+
 // heartbeatInfo stores information about sent heartbeats
 type heartbeatInfo struct {
 	validator string
@@ -52,12 +55,14 @@ type ConsensusMonitor struct {
 	qcLastSeen   map[string]time.Time // last-seen timestamp per signer
 	tcVotes      map[string]int64     // Track TC votes per signer
 	tcLastSeen   map[string]time.Time
+	qcRates      map[string]float64 // last participation rate exported per signer
 	// validatorCache is a bounded, thread-safe LRU. Capacity covers the
 	// active set comfortably and stale entries expire on their own.
 	validatorCache *cache.LRUCache // signer -> validator address
 
 	// sliding window tracking for participation rates
 	qcWindow       []qcWindowEntry
+	qcWindowCounts map[string]int // appearances per signer across qcWindow
 	windowSize     int
 	windowDuration time.Duration
 
@@ -65,7 +70,7 @@ type ConsensusMonitor struct {
 	lastBlockRound int64
 
 	// connectivity tracking
-	disconnectedSet   map[string]bool
+	disconnectedSet   map[connectivityPair]struct{}
 	disconnectedMutex sync.RWMutex
 
 	// Heartbeat tracking
@@ -97,11 +102,13 @@ func NewConsensusMonitor(cfg *config.Config) *ConsensusMonitor {
 		qcLastSeen:      make(map[string]time.Time),
 		tcVotes:         make(map[string]int64),
 		tcLastSeen:      make(map[string]time.Time),
+		qcRates:         make(map[string]float64),
 		validatorCache:  cache.NewLRUCache(validatorCacheSize, validatorCacheTTL),
 		qcWindow:        make([]qcWindowEntry, 0),
+		qcWindowCounts:  make(map[string]int),
 		windowSize:      100,       // keep last 100 blocks for participation calculation
 		windowDuration:  time.Hour, // or calculate based on last hour
-		disconnectedSet: make(map[string]bool),
+		disconnectedSet: make(map[connectivityPair]struct{}),
 		heartbeats:      make(map[float64]heartbeatInfo),
 	}
 }
@@ -126,6 +133,9 @@ func (m *ConsensusMonitor) trimStaleValidators() {
 			delete(m.tcVotes, v)
 		}
 	}
+	// forget exported rates so the next block re-sends all of them; this
+	// also restores any gauge entries dropped by the metrics cleanup
+	m.qcRates = make(map[string]float64)
 }
 
 // core message types for consensus - using dedicated structures to match log format
@@ -150,9 +160,10 @@ type ConsensusBlockMessage struct {
 	Round    uint64 `json:"round"`
 	Proposer string `json:"proposer"`
 	// Evidence
-	QC       *QCEvidence       `json:"qc,omitempty"`
-	TC       json.RawMessage   `json:"tc,omitempty"`
-	Payloads []json.RawMessage `json:"payloads,omitempty"`
+	QC *QCEvidence     `json:"qc,omitempty"`
+	TC json.RawMessage `json:"tc,omitempty"`
+	// payloads are not decoded: nothing reads them and they are the bulk
+	// of a block line
 }
 
 type QCEvidence struct {
@@ -171,7 +182,7 @@ func (m *ConsensusMonitor) formatValidatorAddress(address string) string {
 		addr = "0x" + addr
 	}
 	if len(addr) > 10 {
-		return fmt.Sprintf("%s..%s", addr[:6], addr[len(addr)-4:])
+		return addr[:6] + ".." + addr[len(addr)-4:]
 	}
 	return addr
 }
@@ -227,220 +238,141 @@ func (m *ConsensusMonitor) monitorConsensusLogs(ctx context.Context, errCh chan<
 
 	logger.InfoComponent("consensus", "Starting comprehensive consensus monitoring in: %s", consensusDir)
 
-	var currentFile string
-	var file *os.File
-	var fileReader *bufio.Reader
-	isFirstRun := true
-
-	for {
-		select {
-		case <-ctx.Done():
-			if file != nil {
-				file.Close()
-			}
-			return
-		default:
-			// find the latest log file
-			latestFile, err := m.getLatestConsensusLogFile()
-			if err != nil {
-				if errors.Is(err, os.ErrNotExist) {
-					time.Sleep(10 * time.Second)
-					continue
-				}
-				errCh <- fmt.Errorf("error finding latest consensus log file: %w", err)
-				time.Sleep(5 * time.Second)
-				continue
-			}
-
-			if latestFile == "" {
-				time.Sleep(10 * time.Second)
-				continue
-			}
-
-			// switch to new file if needed
-			if latestFile != currentFile {
-				if file != nil {
-					file.Close()
-					file = nil
-					fileReader = nil
-				}
-
-				file, err = os.Open(latestFile)
-				if err != nil {
-					errCh <- fmt.Errorf("error opening consensus log file: %w", err)
-					time.Sleep(1 * time.Second)
-					continue
-				}
-
-				// skip to end on first run
-				if isFirstRun {
-					_, err = file.Seek(0, io.SeekEnd)
-					if err != nil {
-						errCh <- fmt.Errorf("error seeking to end of file: %w", err)
-						file.Close()
-						file = nil
-						time.Sleep(1 * time.Second)
-						continue
-					}
-					logger.InfoComponent("consensus", "First run: starting to stream from the end of file %s", latestFile)
-					isFirstRun = false
-				} else {
-					logger.InfoComponent("consensus", "Not first run: reading entire file %s", latestFile)
-				}
-
-				fileReader = bufio.NewReader(file)
-				currentFile = latestFile
-			}
-
-			// read and process lines
-			if fileReader != nil {
-				for {
-					line, err := fileReader.ReadString('\n')
-					if err != nil {
-						if err == io.EOF {
-							time.Sleep(10 * time.Millisecond)
-							break
-						}
-						errCh <- fmt.Errorf("error reading consensus log: %w", err)
-						break
-					}
-
-					if err := m.processConsensusLine(line); err != nil {
-						logger.DebugComponent("consensus", "Error processing consensus line: %v", err)
-						metrics.IncrementConsensusMonitorErrors("consensus")
-						m.statsMutex.Lock()
-						m.verificationStats.ParseErrors++
-						m.statsMutex.Unlock()
-					} else {
-						metrics.IncrementConsensusMonitorLines("consensus")
-						metrics.SetConsensusMonitorLastProcessed("consensus", time.Now().Unix())
-						m.statsMutex.Lock()
-						m.verificationStats.LinesProcessed++
-						m.verificationStats.LastProcessedAt = time.Now()
-						m.statsMutex.Unlock()
-					}
-				}
-			}
-		}
+	tailer := &logTailer{
+		component:    "consensus",
+		name:         "consensus log",
+		root:         consensusDir,
+		forcePolling: m.config.ForcePolling,
 	}
+	tailer.run(ctx, errCh, func(line []byte) {
+		if err := m.processConsensusLine(line); err != nil {
+			logger.DebugComponent("consensus", "Error processing consensus line: %v", err)
+			metrics.IncrementConsensusMonitorErrors("consensus")
+			m.statsMutex.Lock()
+			m.verificationStats.ParseErrors++
+			m.statsMutex.Unlock()
+		} else {
+			metrics.IncrementConsensusMonitorLines("consensus")
+			metrics.SetConsensusMonitorLastProcessed("consensus", time.Now().Unix())
+			m.statsMutex.Lock()
+			m.verificationStats.LinesProcessed++
+			m.verificationStats.LastProcessedAt = time.Now()
+			m.statsMutex.Unlock()
+		}
+	})
 }
 
-// processes a single line from consensus logs
-func (m *ConsensusMonitor) processConsensusLine(line string) error {
-	line = strings.TrimSpace(line)
-	if len(line) == 0 || !strings.HasPrefix(line, "[") {
-		return fmt.Errorf("invalid line format")
+// parseConsensusLine decodes a consensus log line in a single pass: the
+// outer arrays are decoded through pointers to their elements, so no part
+// of the line is copied into an intermediate json.RawMessage.
+func parseConsensusLine(line []byte) (consensusLine, error) {
+	line = bytes.TrimSpace(line)
+	if len(line) == 0 || line[0] != '[' {
+		return consensusLine{}, fmt.Errorf("invalid line format")
 	}
 
-	// parse the outer array struct [timestamp, [direction, message]]
-	// use a minimal struct to avoid interface{} allocations
-	var rawParts []json.RawMessage
-	if err := json.Unmarshal([]byte(line), &rawParts); err != nil {
-		return fmt.Errorf("json unmarshal: %w", err)
-	}
-
-	if len(rawParts) < 2 {
-		return fmt.Errorf("unexpected log format")
-	}
-
-	// extract timestamp
-	var timestampStr string
-	if err := json.Unmarshal(rawParts[0], &timestampStr); err != nil {
-		return fmt.Errorf("unmarshal timestamp: %w", err)
+	var timestampStr, direction string
+	var env consensusEnvelope
+	parts := [2]interface{}{&timestampStr, &[2]interface{}{&direction, &env}}
+	if err := json.Unmarshal(line, &parts); err != nil {
+		// a mistyped field inside a payload leaves just that field unset;
+		// anything else (the arrays, the envelope, a payload that is not
+		// an object) means the line itself is broken
+		var typeErr *json.UnmarshalTypeError
+		if !errors.As(err, &typeErr) || !insideConsensusPayload(typeErr.Field) {
+			return consensusLine{}, fmt.Errorf("json unmarshal: %w", err)
+		}
 	}
 
 	parsedTime, err := time.Parse("2006-01-02T15:04:05.999999999", timestampStr)
 	if err != nil {
-		return fmt.Errorf("parse timestamp: %w", err)
+		return consensusLine{}, fmt.Errorf("parse timestamp: %w", err)
 	}
-
-	// parse the inner array [direction, message]
-	var innerParts []json.RawMessage
-	if err := json.Unmarshal(rawParts[1], &innerParts); err != nil {
-		return fmt.Errorf("unmarshal inner parts: %w", err)
+	if direction == "" {
+		return consensusLine{}, fmt.Errorf("unexpected log format: missing direction")
 	}
 
-	if len(innerParts) < 2 {
-		return fmt.Errorf("invalid message format")
+	// incoming messages carry the payload under "msg"
+	msg := &env.consensusMsg
+	if env.Msg != nil {
+		msg = env.Msg
 	}
-
-	// extract direction
-	var direction string
-	if err := json.Unmarshal(innerParts[0], &direction); err != nil {
-		direction = ""
+	if msg.Vote == nil && msg.Block == nil && msg.Heartbeat == nil && msg.HeartbeatAck == nil &&
+		!consensusMessageHasKeys(line) {
+		return consensusLine{}, fmt.Errorf("invalid message format: no message")
 	}
 
-	// check message type using a minimal parse approach
-	msgData := innerParts[1]
+	return consensusLine{
+		Time:      parsedTime,
+		Direction: direction,
+		Source:    env.Source,
+		Msg:       msg,
+	}, nil
+}
 
-	// first check if this has a nested msg struct (for "in" messages)
-	var wrapper struct {
-		Source string          `json:"source"`
-		Msg    json.RawMessage `json:"msg"`
-	}
+// insideConsensusPayload reports whether a type error's field path
+// ("msg.Block.round", "Heartbeat.random_id") lies within a payload rather
+// than naming the payload or an envelope field itself.
+func insideConsensusPayload(field string) bool {
+	return strings.Contains(strings.TrimPrefix(field, "msg."), ".")
+}
 
-	// try to unmarshal as wrapper first
-	if err := json.Unmarshal(msgData, &wrapper); err == nil && len(wrapper.Msg) > 0 {
-		// use the inner msg for processing
-		msgData = wrapper.Msg
+// consensusMessageHasKeys is the slow path for lines that carried none of
+// the payloads the monitor handles: it tells a message kind we don't track
+// (fine) from an empty message (a broken line).
+func consensusMessageHasKeys(line []byte) bool {
+	var outer, inner [2]json.RawMessage
+	if json.Unmarshal(line, &outer) != nil || json.Unmarshal(outer[1], &inner) != nil {
+		return false
 	}
-
-	// try to detect message type by looking for specific fields
-	if bytes.Contains(msgData, []byte(`"Vote"`)) {
-		var msg struct {
-			Vote json.RawMessage `json:"Vote"`
-		}
-		if err := json.Unmarshal(msgData, &msg); err == nil && len(msg.Vote) > 0 {
-			var voteMsg ConsensusVoteMessage
-			if err := json.Unmarshal(msg.Vote, &voteMsg); err == nil {
-				// Outgoing votes wrap the payload one level deeper under
-				// `vote`. If we got nothing useful at the top level, peel
-				// one more layer and re-decode.
-				if voteMsg.Validator == "" && voteMsg.SignerId == "" {
-					var outer struct {
-						Vote json.RawMessage `json:"vote"`
-					}
-					if json.Unmarshal(msg.Vote, &outer) == nil && len(outer.Vote) > 0 {
-						_ = json.Unmarshal(outer.Vote, &voteMsg)
-					}
-				}
-				// For incoming votes the validator who SENT the vote is the
-				// outer "source"; fall back to that if the payload itself
-				// didn't name them.
-				if voteMsg.Validator == "" && voteMsg.SignerId == "" && wrapper.Source != "" {
-					voteMsg.Validator = wrapper.Source
-				}
-				return m.processVoteStruct(&voteMsg, parsedTime)
-			}
-		}
-	} else if bytes.Contains(msgData, []byte(`"Block"`)) {
-		var msg struct {
-			Block json.RawMessage `json:"Block"`
-		}
-		if err := json.Unmarshal(msgData, &msg); err == nil && len(msg.Block) > 0 {
-			return m.processBlockRaw(msg.Block)
-		}
-	} else if bytes.Contains(msgData, []byte(`"Heartbeat"`)) && direction == "out" {
-		var msg struct {
-			Heartbeat json.RawMessage `json:"Heartbeat"`
+	var keys map[string]json.RawMessage
+	if json.Unmarshal(inner[1], &keys) != nil {
+		return false
+	}
+	if msg, ok := keys["msg"]; ok {
+		keys = nil
+		if json.Unmarshal(msg, &keys) != nil {
+			return false
 		}
-		if err := json.Unmarshal(msgData, &msg); err == nil && len(msg.Heartbeat) > 0 {
-			var hbMsg HeartbeatMessage
-			if err := json.Unmarshal(msg.Heartbeat, &hbMsg); err == nil {
-				return m.processHeartbeatOut(&hbMsg, parsedTime)
+	} else {
+		delete(keys, "source")
+	}
+	return len(keys) > 0
+}
+
+// processes a single line from consensus logs
+func (m *ConsensusMonitor) processConsensusLine(line []byte) error {
+	cl, err := parseConsensusLine(line)
+	if err != nil {
+		return err
+	}
+
+	msg := cl.Msg
+	switch {
+	case msg.Vote != nil:
+		voteMsg := msg.Vote.ConsensusVoteMessage
+		// Outgoing votes wrap the payload one level deeper under
+		// `vote`. If we got nothing useful at the top level, use that.
+		if voteMsg.Validator == "" && voteMsg.SignerId == "" && msg.Vote.Vote != nil {
+			nested := msg.Vote.Vote
+			voteMsg.Validator, voteMsg.SignerId = nested.Validator, nested.SignerId
+			if nested.Round != 0 {
+				voteMsg.Round = nested.Round
 			}
 		}
-	} else if bytes.Contains(msgData, []byte(`"HeartbeatAck"`)) && direction == "in" {
-		// Handle HeartbeatAck which might be in wrapper structure
-		var msg struct {
-			HeartbeatAck json.RawMessage `json:"HeartbeatAck"`
-		}
-		if err := json.Unmarshal(msgData, &msg); err == nil && len(msg.HeartbeatAck) > 0 {
-			var ackMsg HeartbeatAckMessage
-			if err := json.Unmarshal(msg.HeartbeatAck, &ackMsg); err == nil {
-				return m.processHeartbeatAck(&ackMsg, wrapper.Source, parsedTime)
-			}
+		// For incoming votes the validator who SENT the vote is the
+		// outer "source"; fall back to that if the payload itself
+		// didn't name them.
+		if voteMsg.Validator == "" && voteMsg.SignerId == "" && cl.Source != "" {
+			voteMsg.Validator = cl.Source
 		}
+		return m.processVoteStruct(&voteMsg, cl.Time)
+	case msg.Block != nil:
+		return m.processBlock(msg.Block)
+	case msg.Heartbeat != nil && cl.Direction == "out":
+		return m.processHeartbeatOut(msg.Heartbeat, cl.Time)
+	case msg.HeartbeatAck != nil && cl.Direction == "in":
+		return m.processHeartbeatAck(msg.HeartbeatAck, cl.Source, cl.Time)
 	}
 
 	return nil
@@ -472,23 +404,22 @@ func (m *ConsensusMonitor) processVoteStruct(vote *ConsensusVoteMessage, timesta
 }
 
 // processes the block message
-func (m *ConsensusMonitor) processBlockRaw(blockData json.RawMessage) error {
-	var block ConsensusBlockMessage
-	if err := json.Unmarshal(blockData, &block); err != nil {
-		return fmt.Errorf("unmarshal block: %w", err)
-	}
-
+func (m *ConsensusMonitor) processBlock(block *ConsensusBlockMessage) error {
 	// get val addr for proposer
 	proposer := m.getValidatorForSigner(block.Proposer)
 	if proposer == "" {
-		logger.DebugComponent("consensus", "No validator mapping for proposer: %s", block.Proposer)
+		if logger.DebugEnabled() {
+			logger.DebugComponent("consensus", "No validator mapping for proposer: %s", block.Proposer)
+		}
 		proposer = block.Proposer
 	}
 	formattedProposer := m.formatValidatorAddress(proposer)
 
 	// log block processing
-	logger.DebugComponent("consensus", "Processing block - Round: %d, Proposer: %s, Has TC: %v, Has QC: %v",
-		block.Round, formattedProposer, block.TC != nil, block.QC != nil)
+	if logger.DebugEnabled() {
+		logger.DebugComponent("consensus", "Processing block - Round: %d, Proposer: %s, Has TC: %v, Has QC: %v",
+			block.Round, formattedProposer, block.TC != nil, block.QC != nil)
+	}
 
 	// update consensus round metrics
 	blockRound := int64(block.Round)
@@ -514,8 +445,21 @@ func (m *ConsensusMonitor) processBlockRaw(blockData json.RawMessage) error {
 
 	// process QC signatures
 	if block.QC != nil {
-		logger.DebugComponent("consensus", "Block has QC with %d signers", len(block.QC.Signers))
+		if logger.DebugEnabled() {
+			logger.DebugComponent("consensus", "Block has QC with %d signers", len(block.QC.Signers))
+		}
 		if len(block.QC.Signers) > 0 {
+			// track QC signatures (bounded by trimStaleValidators)
+			now := time.Now()
+			m.mapsMu.Lock()
+			for _, signer := range block.QC.Signers {
+				if signer != "" {
+					m.qcSignatures[signer]++
+					m.qcLastSeen[signer] = now
+				}
+			}
+			m.mapsMu.Unlock()
+
 			for _, signer := range block.QC.Signers {
 				// use the signer ID directly as it's already in truncated format from logs
 				validator := signer
@@ -524,19 +468,13 @@ func (m *ConsensusMonitor) processBlockRaw(blockData json.RawMessage) error {
 					continue
 				}
 
-				formattedValidator := m.formatValidatorAddress(validator)
-
-				// track QC signatures (bounded by trimStaleValidators)
-				m.mapsMu.Lock()
-				m.qcSignatures[validator]++
-				m.qcLastSeen[validator] = time.Now()
-				m.mapsMu.Unlock()
-
-				metrics.IncrementQCSignatures(formattedValidator)
+				metrics.IncrementQCSignatures(m.formatValidatorAddress(validator))
 			}
 
-			logger.DebugComponent("consensus", "Processed QC with %d signers in block round %d",
-				len(block.QC.Signers), block.Round)
+			if logger.DebugEnabled() {
+				logger.DebugComponent("consensus", "Processed QC with %d signers in block round %d",
+					len(block.QC.Signers), block.Round)
+			}
 		}
 
 		// record QC size for histogram
@@ -581,8 +519,10 @@ func (m *ConsensusMonitor) processBlockRaw(blockData json.RawMessage) error {
 				}
 			}
 
-			logger.DebugComponent("consensus", "Processed TC with %d timeout votes in block round %d",
-				len(tc.Timeouts), block.Round)
+			if logger.DebugEnabled() {
+				logger.DebugComponent("consensus", "Processed TC with %d timeout votes in block round %d",
+					len(tc.Timeouts), block.Round)
+			}
 		} else {
 			logger.DebugComponent("consensus", "Failed to parse TC data: %v", err)
 		}
@@ -633,13 +573,9 @@ func (m *ConsensusMonitor) loadValidatorMappings() error {
 	return nil
 }
 
-// returns the path to the latest consensus log file
-func (m *ConsensusMonitor) getLatestConsensusLogFile() (string, error) {
-	consensusDir := filepath.Join(m.config.NodeHome, "data", "node_logs", "consensus", "hourly")
-	return utils.GetLatestFile(consensusDir)
-}
-
-// addQCWindowEntry adds a new QC entry to the sliding window
+// addQCWindowEntry adds a new QC entry to the sliding window and keeps
+// qcWindowCounts in step with it, so participation rates don't need a
+// recount of the whole window per block
 func (m *ConsensusMonitor) addQCWindowEntry(signers []string) {
 	entry := qcWindowEntry{
 		timestamp: time.Now(),
@@ -647,20 +583,31 @@ func (m *ConsensusMonitor) addQCWindowEntry(signers []string) {
 	}
 
 	m.qcWindow = append(m.qcWindow, entry)
+	for _, signer := range signers {
+		m.qcWindowCounts[signer]++
+	}
 
 	// trim window by size
+	drop := 0
 	if len(m.qcWindow) > m.windowSize {
-		m.qcWindow = m.qcWindow[len(m.qcWindow)-m.windowSize:]
+		drop = len(m.qcWindow) - m.windowSize
 	}
 
 	// also trim by time
 	cutoff := time.Now().Add(-m.windowDuration)
-	i := 0
-	for i < len(m.qcWindow) && m.qcWindow[i].timestamp.Before(cutoff) {
-		i++
+	for drop < len(m.qcWindow) && m.qcWindow[drop].timestamp.Before(cutoff) {
+		drop++
 	}
-	if i > 0 {
-		m.qcWindow = m.qcWindow[i:]
+
+	if drop > 0 {
+		for _, old := range m.qcWindow[:drop] {
+			for _, signer := range old.signers {
+				if m.qcWindowCounts[signer]--; m.qcWindowCounts[signer] <= 0 {
+					delete(m.qcWindowCounts, signer)
+				}
+			}
+		}
+		m.qcWindow = m.qcWindow[drop:]
 	}
 }
 
@@ -696,7 +643,9 @@ func (m *ConsensusMonitor) processHeartbeatOut(hb *HeartbeatMessage, timestamp t
 	// Increment heartbeat sent counter
 	metrics.IncrementHeartbeatsSent(formattedValidator)
 
-	logger.DebugComponent("consensus", "Registered outgoing heartbeat from %s with ID %.0f", formattedValidator, hb.RandomID)
+	if logger.DebugEnabled() {
+		logger.DebugComponent("consensus", "Registered outgoing heartbeat from %s with ID %.0f", formattedValidator, hb.RandomID)
+	}
 
 	return nil
 }
@@ -732,48 +681,57 @@ func (m *ConsensusMonitor) processHeartbeatAck(ack *HeartbeatAckMessage, source
 	metrics.IncrementHeartbeatAcksReceived(fromValidator, toValidator)
 	metrics.RecordHeartbeatAckDelay(fromValidator, toValidator, float64(delay.Milliseconds()))
 
-	logger.DebugComponent("consensus", "Heartbeat ack from %s to %s, delay: %v", toValidator, fromValidator, delay)
+	if logger.DebugEnabled() {
+		logger.DebugComponent("consensus", "Heartbeat ack from %s to %s, delay: %v", toValidator, fromValidator, delay)
+	}
 
 	return nil
 }
 
 // calculates and updates QC participation rates for all validators
 func (m *ConsensusMonitor) updateQCParticipationRates() {
-	if len(m.qcWindow) == 0 {
-		return
+	for validator, rate := range m.changedQCRates() {
+		formattedValidator := m.formatValidatorAddress(validator)
+		metrics.SetQCParticipationRate(formattedValidator, rate)
 	}
+}
 
-	// count participation per validator
-	participationCount := make(map[string]int)
-	for _, entry := range m.qcWindow {
-		for _, signer := range entry.signers {
-			participationCount[signer]++
-		}
+// changedQCRates records the current participation rate of every validator
+// in qcRates and returns only the ones that moved since the previous call;
+// with a full window that is usually none of them
+func (m *ConsensusMonitor) changedQCRates() map[string]float64 {
+	if len(m.qcWindow) == 0 {
+		return nil
 	}
 
+	// participation per validator, maintained by addQCWindowEntry
+	participationCount := m.qcWindowCounts
+
 	// calculate rates
 	totalBlocks := float64(len(m.qcWindow))
 
-	// update metrics for validators who participated
+	m.mapsMu.Lock()
+	defer m.mapsMu.Unlock()
+	changed := make(map[string]float64)
 	for validator, count := range participationCount {
 		rate := (float64(count) / totalBlocks) * 100
-		formattedValidator := m.formatValidatorAddress(validator)
-		metrics.SetQCParticipationRate(formattedValidator, rate)
+		if last, ok := m.qcRates[validator]; !ok || last != rate {
+			m.qcRates[validator] = rate
+			changed[validator] = rate
+		}
 	}
 
 	// set rate to 0 for validators who haven't participated
-	m.mapsMu.Lock()
-	knownValidators := make([]string, 0, len(m.qcSignatures))
-	for v := range m.qcSignatures {
-		knownValidators = append(knownValidators, v)
-	}
-	m.mapsMu.Unlock()
-	for _, validator := range knownValidators {
-		if _, exists := participationCount[validator]; !exists {
-			formattedValidator := m.formatValidatorAddress(validator)
-			metrics.SetQCParticipationRate(formattedValidator, 0)
+	for validator := range m.qcSignatures {
+		if _, exists := participationCount[validator]; exists {
+			continue
+		}
+		if last, ok := m.qcRates[validator]; !ok || last != 0 {
+			m.qcRates[validator] = 0
+			changed[validator] = 0
 		}
 	}
+	return changed
 }
 
 // monitors the status log files for additional consensus info
@@ -788,95 +746,28 @@ func (m *ConsensusMonitor) monitorStatusLogs(ctx context.Context, errCh chan<- e
 
 	logger.InfoComponent("consensus", "Starting status log monitoring in: %s", statusDir)
 
-	var currentFile string
-	var fileReader *bufio.Reader
-	isFirstRun := true
-
-	for {
-		select {
-		case <-ctx.Done():
-			return
-		default:
-			// find latest log file
-			latestFile, err := utils.GetLatestFile(statusDir)
-			if err != nil {
-				if errors.Is(err, os.ErrNotExist) {
-					time.Sleep(10 * time.Second)
-					continue
-				}
-				errCh <- fmt.Errorf("error finding latest status log file: %w", err)
-				time.Sleep(5 * time.Second)
-				continue
-			}
-
-			if latestFile == "" {
-				time.Sleep(10 * time.Second)
-				continue
-			}
-
-			// switch to new file if needed
-			if latestFile != currentFile {
-				if fileReader != nil {
-					fileReader = nil
-				}
-
-				file, err := os.Open(latestFile)
-				if err != nil {
-					errCh <- fmt.Errorf("error opening status log file: %w", err)
-					time.Sleep(1 * time.Second)
-					continue
-				}
-
-				// skip to end on first run
-				if isFirstRun {
-					_, err = file.Seek(0, io.SeekEnd)
-					if err != nil {
-						errCh <- fmt.Errorf("error seeking to end of file: %w", err)
-						file.Close()
-						time.Sleep(1 * time.Second)
-						continue
-					}
-					logger.InfoComponent("consensus", "First run: starting to stream status from the end of file %s", latestFile)
-					isFirstRun = false
-				} else {
-					logger.InfoComponent("consensus", "Not first run: reading entire status file %s", latestFile)
-				}
-
-				fileReader = bufio.NewReader(file)
-				currentFile = latestFile
-			}
-
-			// read and process lines
-			if fileReader != nil {
-				for {
-					line, err := fileReader.ReadString('\n')
-					if err != nil {
-						if err == io.EOF {
-							time.Sleep(10 * time.Millisecond)
-							break
-						}
-						errCh <- fmt.Errorf("error reading status log: %w", err)
-						break
-					}
-
-					if err := m.processStatusLine(line); err != nil {
-						logger.DebugComponent("consensus", "Error processing status line: %v", err)
-						metrics.IncrementConsensusMonitorErrors("status")
-					} else {
-						metrics.IncrementConsensusMonitorLines("status")
-						metrics.SetConsensusMonitorLastProcessed("status", time.Now().Unix())
-					}
-				}
-			}
-		}
+	tailer := &logTailer{
+		component:    "consensus",
+		name:         "status log",
+		root:         statusDir,
+		forcePolling: m.config.ForcePolling,
 	}
+	tailer.run(ctx, errCh, func(line []byte) {
+		if err := m.processStatusLine(line); err != nil {
+			logger.DebugComponent("consensus", "Error processing status line: %v", err)
+			metrics.IncrementConsensusMonitorErrors("status")
+		} else {
+			metrics.IncrementConsensusMonitorLines("status")
+			metrics.SetConsensusMonitorLastProcessed("status", time.Now().Unix())
+		}
+	})
 }
 
 // processStatusLine processes a single line from status logs
-func (m *ConsensusMonitor) processStatusLine(line string) error {
+func (m *ConsensusMonitor) processStatusLine(line []byte) error {
 	// parse the outer array [timestamp, data]
 	var rawParts []json.RawMessage
-	if err := json.Unmarshal([]byte(line), &rawParts); err != nil {
+	if err := json.Unmarshal(line, &rawParts); err != nil {
 		return fmt.Errorf("json unmarshal: %w", err)
 	}
 
@@ -907,40 +798,47 @@ func (m *ConsensusMonitor) processStatusLine(line string) error {
 	return nil
 }
 
+// decodeStatusList decodes a status log list into a slice of fixed-size
+// arrays. An item of the wrong shape (an object, a non-string peer) is left
+// zero-valued and skipped by the caller instead of failing the whole list;
+// a value that is not a list at all is still an error.
+func decodeStatusList(data json.RawMessage, v interface{}) error {
+	err := json.Unmarshal(data, v)
+	var typeErr *json.UnmarshalTypeError
+	if errors.As(err, &typeErr) && bytes.HasPrefix(bytes.TrimSpace(data), []byte("[")) {
+		return nil
+	}
+	return err
+}
+
 // processes disconnected validators from raw JSON
 func (m *ConsensusMonitor) processDisconnectedValidatorsRaw(data json.RawMessage) {
 	// parse as array of [validator, [[peer, round], ...]]
-	var discList []json.RawMessage
-	if err := json.Unmarshal(data, &discList); err != nil {
+	var discList [][2]json.RawMessage
+	if err := decodeStatusList(data, &discList); err != nil {
 		logger.DebugComponent("consensus", "Failed to parse disconnected validators: %v", err)
 		return
 	}
 
-	newDisconnected := make(map[string]bool)
-
-	for _, item := range discList {
-		var entry []json.RawMessage
-		if err := json.Unmarshal(item, &entry); err != nil || len(entry) < 2 {
-			continue
-		}
+	m.disconnectedMutex.RLock()
+	newDisconnected := make(map[connectivityPair]struct{}, len(m.disconnectedSet))
+	m.disconnectedMutex.RUnlock()
 
+	for _, entry := range discList {
 		var valAddr string
 		if err := json.Unmarshal(entry[0], &valAddr); err != nil {
 			continue
 		}
 
-		var peerList [][]json.RawMessage
-		if err := json.Unmarshal(entry[1], &peerList); err != nil {
+		// only the peer is needed; a fixed-size array drops the round
+		var peerList [][1]string
+		if err := decodeStatusList(entry[1], &peerList); err != nil {
 			continue
 		}
 
-		for _, peerData := range peerList {
-			if len(peerData) > 0 {
-				var peerAddr string
-				if err := json.Unmarshal(peerData[0], &peerAddr); err == nil {
-					key := fmt.Sprintf("%s_%s", valAddr, peerAddr)
-					newDisconnected[key] = true
-				}
+		for _, peer := range peerList {
+			if peer[0] != "" {
+				newDisconnected[connectivityPair{valAddr, peer[0]}] = struct{}{}
 			}
 		}
 	}
@@ -949,24 +847,17 @@ func (m *ConsensusMonitor) processDisconnectedValidatorsRaw(data json.RawMessage
 	m.disconnectedMutex.Lock()
 
 	// remove metrics for validators that are now connected
-	for oldKey := range m.disconnectedSet {
-		if _, stillDisconnected := newDisconnected[oldKey]; !stillDisconnected {
+	for old := range m.disconnectedSet {
+		if _, stillDisconnected := newDisconnected[old]; !stillDisconnected {
 			// validator is now connected - remove the metric entirely instead of setting to 1
-			parts := strings.Split(oldKey, "_")
-			if len(parts) == 2 {
-				// this will remove the metric from the labeledValues map
-				metrics.RemoveValidatorConnectivity(parts[0], parts[1])
-			}
+			metrics.RemoveValidatorConnectivity(old.validator, old.peer)
 		}
 	}
 
 	// only set metrics for disconnected pairs (value 0)
-	for newKey := range newDisconnected {
-		if _, wasDisconnected := m.disconnectedSet[newKey]; !wasDisconnected {
-			parts := strings.Split(newKey, "_")
-			if len(parts) == 2 {
-				metrics.SetValidatorConnectivity(parts[0], parts[1], 0)
-			}
+	for pair := range newDisconnected {
+		if _, wasDisconnected := m.disconnectedSet[pair]; !wasDisconnected {
+			metrics.SetValidatorConnectivity(pair.validator, pair.peer, 0)
 		}
 	}
 
@@ -977,18 +868,13 @@ func (m *ConsensusMonitor) processDisconnectedValidatorsRaw(data json.RawMessage
 // processes heartbeat status information from raw JSON
 func (m *ConsensusMonitor) processHeartbeatStatusesRaw(data json.RawMessage) {
 	// parse as array of [validator, {status_info}]
-	var hsList []json.RawMessage
-	if err := json.Unmarshal(data, &hsList); err != nil {
+	var hsList [][2]json.RawMessage
+	if err := decodeStatusList(data, &hsList); err != nil {
 		logger.DebugComponent("consensus", "Failed to parse heartbeat statuses: %v", err)
 		return
 	}
 
-	for _, item := range hsList {
-		var entry []json.RawMessage
-		if err := json.Unmarshal(item, &entry); err != nil || len(entry) < 2 {
-			continue
-		}
-
+	for _, entry := range hsList {
 		var valAddr string
 		if err := json.Unmarshal(entry[0], &valAddr); err != nil {
 			continue
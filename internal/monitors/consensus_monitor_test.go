@@ -0,0 +1,183 @@
+package monitors
+
+import (
+	"reflect"
+	"testing"
+	"time"
+
+	"github.com/validaoxyz/hyperliquid-exporter/internal/config"
+)
+
+func TestParseConsensusLineOutgoingVote(t *testing.T) {
+	line := []byte(`["2026-05-25T11:12:20.656667039",["out",{"Vote":{"vote":{"validator":"0xabc0000000000000000000000000000000000001","round":812345,"block_hash":"0xdead"},"destination":"0xdef0000000000000000000000000000000000002"}}]]`)
+	cl, err := parseConsensusLine(line)
+	if err != nil {
+		t.Fatalf("parse failed: %v", err)
+	}
+	want := time.Date(2026, 5, 25, 11, 12, 20, 656667039, time.UTC)
+	if !cl.Time.Equal(want) {
+		t.Errorf("time = %v, want %v", cl.Time, want)
+	}
+	if cl.Direction != "out" {
+		t.Errorf("direction = %q, want out", cl.Direction)
+	}
+	if cl.Msg.Vote == nil || cl.Msg.Vote.Vote == nil {
+		t.Fatal("nested vote not decoded")
+	}
+	if got := cl.Msg.Vote.Vote.Validator; got != "0xabc0000000000000000000000000000000000001" {
+		t.Errorf("validator = %q", got)
+	}
+	if cl.Msg.Vote.Vote.Round != 812345 {
+		t.Errorf("round = %d, want 812345", cl.Msg.Vote.Vote.Round)
+	}
+}
+
+func TestParseConsensusLineIncomingBlock(t *testing.T) {
+	line := []byte(`["2026-05-25T11:12:21.1",["in",{"source":"0xfeed","msg":{"Block":{"round":812346,"proposer":"0xabc0000000000000000000000000000000000001","qc":{"round":812345,"signers":["0xa","0xb","0xc"]},"payloads":[{"txs":[{"Vote":1}]}]}}}]]`)
+	cl, err := parseConsensusLine(line)
+	if err != nil {
+		t.Fatalf("parse failed: %v", err)
+	}
+	if cl.Direction != "in" || cl.Source != "0xfeed" {
+		t.Errorf("direction/source = %q/%q", cl.Direction, cl.Source)
+	}
+	// a "Vote" key inside the payloads must not be mistaken for a vote
+	if cl.Msg.Vote != nil {
+		t.Error("block decoded as vote")
+	}
+	b := cl.Msg.Block
+	if b == nil {
+		t.Fatal("block not decoded")
+	}
+	if b.Round != 812346 || b.QC == nil || len(b.QC.Signers) != 3 {
+		t.Errorf("block = %+v", b)
+	}
+}
+
+func TestParseConsensusLineHeartbeat(t *testing.T) {
+	cl, err := parseConsensusLine([]byte(`["2026-05-25T11:12:22",["out",{"Heartbeat":{"validator":"0xabc","random_id":4242}}]]`))
+	if err != nil {
+		t.Fatalf("parse failed: %v", err)
+	}
+	if cl.Msg.Heartbeat == nil || cl.Msg.Heartbeat.RandomID != 4242 {
+		t.Errorf("heartbeat = %+v", cl.Msg.Heartbeat)
+	}
+
+	// a mistyped field only loses that field
+	cl, err = parseConsensusLine([]byte(`["2026-05-25T11:12:22",["in",{"source":"0xabc","msg":{"HeartbeatAck":{"random_id":"x"}}}]]`))
+	if err != nil {
+		t.Fatalf("parse failed: %v", err)
+	}
+	if cl.Msg.HeartbeatAck == nil || cl.Source != "0xabc" {
+		t.Errorf("ack not decoded: %+v", cl)
+	}
+
+	// a message kind the monitor doesn't track is not an error
+	cl, err = parseConsensusLine([]byte(`["2026-05-25T11:12:22",["in",{"source":"0xabc","msg":{"Timeout":{"round":7}}}]]`))
+	if err != nil {
+		t.Fatalf("parse failed: %v", err)
+	}
+	if cl.Msg.Vote != nil || cl.Msg.Block != nil || cl.Msg.Heartbeat != nil || cl.Msg.HeartbeatAck != nil {
+		t.Errorf("untracked message decoded: %+v", cl.Msg)
+	}
+}
+
+func TestParseConsensusLineErrors(t *testing.T) {
+	for _, line := range []string{
+		``,
+		`{"not":"an array"}`,
+		`["2026-05-25T11:12:22",["out",{"Heartbeat":`,
+		`["yesterday",["out",{}]]`,
+		`["2026-05-25T11:12:22","garbage"]`,
+		`["2026-05-25T11:12:22"]`,
+		`["2026-05-25T11:12:22",["out",42]]`,
+		`["2026-05-25T11:12:22",["out",{}]]`,
+		`["2026-05-25T11:12:22",["in",{"source":"0xabc","msg":{"Block":"oops"}}]]`,
+		`["2026-05-25T11:12:22",["out",{"Block":"oops"}]]`,
+	} {
+		if _, err := parseConsensusLine([]byte(line)); err == nil {
+			t.Errorf("%q: expected error", line)
+		}
+	}
+}
+
+func TestDisconnectedValidatorsSkipMalformedEntries(t *testing.T) {
+	m := NewConsensusMonitor(&config.Config{})
+	// an object entry, a non-string peer and a short entry must only lose
+	// themselves, not the rest of the list
+	m.processDisconnectedValidatorsRaw([]byte(`[
+		["0xa",[["0xb",1],[42,2],["0xc",3]]],
+		{"validator":"0xd"},
+		["0xe"],
+		["0xf",[["0xa",4]]]
+	]`))
+
+	want := map[connectivityPair]struct{}{
+		{"0xa", "0xb"}: {},
+		{"0xa", "0xc"}: {},
+		{"0xf", "0xa"}: {},
+	}
+	if !reflect.DeepEqual(m.disconnectedSet, want) {
+		t.Errorf("disconnected = %v, want %v", m.disconnectedSet, want)
+	}
+}
+
+func TestDisconnectedValidatorsKeepStateOnNonList(t *testing.T) {
+	m := NewConsensusMonitor(&config.Config{})
+	m.processDisconnectedValidatorsRaw([]byte(`[["0xa",[["0xb",1]]]]`))
+	want := map[connectivityPair]struct{}{{"0xa", "0xb"}: {}}
+
+	for _, data := range []string{`{}`, `42`, `"0xa"`} {
+		m.processDisconnectedValidatorsRaw([]byte(data))
+		if !reflect.DeepEqual(m.disconnectedSet, want) {
+			t.Errorf("%s: disconnected = %v, want %v", data, m.disconnectedSet, want)
+		}
+	}
+}
+
+func TestQCWindowCountsAndChangedRates(t *testing.T) {
+	m := NewConsensusMonitor(&config.Config{})
+	m.windowSize = 3
+	for _, v := range []string{"a", "b", "c"} {
+		m.qcSignatures[v] = 1
+	}
+	rate := func(n, of int) float64 { return float64(n) / float64(of) * 100 }
+
+	step := func(signers []string, want map[string]float64) {
+		t.Helper()
+		m.addQCWindowEntry(signers)
+
+		recount := make(map[string]int)
+		for _, e := range m.qcWindow {
+			for _, s := range e.signers {
+				recount[s]++
+			}
+		}
+		if !reflect.DeepEqual(m.qcWindowCounts, recount) {
+			t.Fatalf("after %v: counts = %v, recount = %v", signers, m.qcWindowCounts, recount)
+		}
+
+		if got := m.changedQCRates(); !reflect.DeepEqual(got, want) {
+			t.Fatalf("after %v: changed = %v, want %v", signers, got, want)
+		}
+		for v := range m.qcSignatures {
+			if m.qcRates[v] != rate(recount[v], len(m.qcWindow)) {
+				t.Fatalf("after %v: qcRates[%s] = %v, want %v", signers, v, m.qcRates[v], rate(recount[v], len(m.qcWindow)))
+			}
+		}
+	}
+
+	step([]string{"a", "b"}, map[string]float64{"a": 100, "b": 100, "c": 0})
+	step([]string{"a"}, map[string]float64{"b": rate(1, 2)})
+	step([]string{"a", "c"}, map[string]float64{"b": rate(1, 3), "c": rate(1, 3)})
+	// past windowSize: the first entry leaves, and no rate moves
+	step([]string{"a", "b"}, map[string]float64{})
+
+	// past the time cutoff: the two oldest remaining entries leave too
+	m.qcWindow[0].timestamp = time.Now().Add(-2 * m.windowDuration)
+	m.qcWindow[1].timestamp = time.Now().Add(-2 * m.windowDuration)
+	step([]string{"c"}, map[string]float64{"a": rate(1, 2), "b": rate(1, 2), "c": rate(1, 2)})
+	if len(m.qcWindow) != 2 {
+		t.Errorf("window holds %d entries, want 2", len(m.qcWindow))
+	}
+}
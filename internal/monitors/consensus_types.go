@@ -2,8 +2,47 @@ package monitors
 
 import (
 	"encoding/json"
+	"time"
 )
 
+// consensusLine is one decoded consensus log line,
+//
+//	[timestamp, [direction, message]]
+//
+// where message is the payload itself for outgoing traffic
+// ({"Vote": ...}) and {"source": ..., "msg": {"Vote": ...}} for incoming.
+type consensusLine struct {
+	Time      time.Time
+	Direction string
+	Source    string
+	Msg       *consensusMsg
+}
+
+// consensusMsg holds whichever payload the message carried; the others
+// stay nil. Decoding straight into these skips every other key (block
+// payloads, hashes) without copying it.
+type consensusMsg struct {
+	Vote         *consensusVotePayload  `json:"Vote"`
+	Block        *ConsensusBlockMessage `json:"Block"`
+	Heartbeat    *HeartbeatMessage      `json:"Heartbeat"`
+	HeartbeatAck *HeartbeatAckMessage   `json:"HeartbeatAck"`
+}
+
+// consensusEnvelope matches both message shapes: the incoming wrapper's
+// fields plus, embedded, the payload keys of an outgoing message.
+type consensusEnvelope struct {
+	Source string        `json:"source"`
+	Msg    *consensusMsg `json:"msg"`
+	consensusMsg
+}
+
+// consensusVotePayload is the Vote payload; outgoing votes nest the
+// fields one level deeper under `vote` (see ConsensusVoteMessage).
+type consensusVotePayload struct {
+	ConsensusVoteMessage
+	Vote *ConsensusVoteMessage `json:"vote"`
+}
+
 // ConsensusLogEntry represents a parsed consensus log line
 type ConsensusLogEntry struct {
 	Timestamp string          `json:"-"`
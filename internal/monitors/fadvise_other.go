@@ -0,0 +1,10 @@
+//go:build !linux
+
+package monitors
+
+import "os"
+
+// Non-Linux stub. posix_fadvise is not available everywhere and the
+// read-ahead hint only matters on production nodes.
+
+func adviseSequential(_ *os.File) {}
@@ -0,0 +1,121 @@
+package monitors
+
+import (
+	"context"
+	"time"
+
+	"github.com/validaoxyz/hyperliquid-exporter/internal/logger"
+)
+
+const (
+	// tailPollInterval is the wake-up cadence when OS change notifications
+	// are unavailable (non-Linux, inotify limits exhausted) or disabled by
+	// --force-polling for NFS/FUSE mounts that never deliver them.
+	tailPollInterval = 500 * time.Millisecond
+
+	// tailSafetyInterval is the wake-up cadence while notifications are
+	// active. Events normally arrive within milliseconds of a write; this
+	// only bounds the damage if one is ever lost.
+	tailSafetyInterval = 5 * time.Second
+)
+
+// notifier is the platform hook behind fileWatcher. watch replaces the
+// current watch set with the directory chain from file's parent up to
+// root; the implementation calls the onChange func it was built with
+// whenever anything in that set changes. watchDir instead watches dir
+// alone, without following subdirectories created under it.
+type notifier interface {
+	watch(root, file string) error
+	watchDir(dir string) error
+	close() error
+}
+
+// fileWatcher parks a tail loop until the file it follows, or any
+// directory between that file and the log root, changes. Wake-ups are
+// coalesced: a burst of writes between two wait calls costs one wake.
+//
+// On Linux this is backed by one inotify instance shared by all watchers;
+// elsewhere (and with forcePolling) it degrades to a fixed
+// tailPollInterval sleep.
+type fileWatcher struct {
+	component string
+	changed   chan struct{}
+	interval  time.Duration
+	notifier  notifier
+}
+
+func newFileWatcher(component string, forcePolling bool) *fileWatcher {
+	w := &fileWatcher{
+		component: component,
+		changed:   make(chan struct{}, 1),
+		interval:  tailPollInterval,
+	}
+	if forcePolling {
+		return w
+	}
+	n, err := newNotifier(w.signal)
+	if err != nil {
+		logger.DebugComponent(component, "file change notifications unavailable, polling every %v: %v", tailPollInterval, err)
+		return w
+	}
+	w.notifier = n
+	w.interval = tailSafetyInterval
+	return w
+}
+
+func (w *fileWatcher) signal() {
+	select {
+	case w.changed <- struct{}{}:
+	default:
+	}
+}
+
+// watch points the watcher at file (which may be empty when root holds no
+// files yet). Call it again after every rotation.
+func (w *fileWatcher) watch(root, file string) {
+	if w.notifier == nil {
+		return
+	}
+	if err := w.notifier.watch(root, file); err != nil {
+		logger.DebugComponent(w.component, "cannot watch %s, polling every %v: %v", root, tailPollInterval, err)
+		w.interval = tailPollInterval
+		return
+	}
+	w.interval = tailSafetyInterval
+}
+
+// watchDir points the watcher at the entries of dir itself, for callers
+// that follow one file in a directory they do not own (hl-node in $HOME).
+// Unlike watch, new subdirectories are not added, so the watch set never
+// grows.
+func (w *fileWatcher) watchDir(dir string) {
+	if w.notifier == nil {
+		return
+	}
+	if err := w.notifier.watchDir(dir); err != nil {
+		logger.DebugComponent(w.component, "cannot watch %s, polling every %v: %v", dir, tailPollInterval, err)
+		w.interval = tailPollInterval
+		return
+	}
+	w.interval = tailSafetyInterval
+}
+
+// wait blocks until a change is signalled or the current interval
+// elapses. It returns false once ctx is cancelled.
+func (w *fileWatcher) wait(ctx context.Context) bool {
+	t := time.NewTimer(w.interval)
+	defer t.Stop()
+	select {
+	case <-ctx.Done():
+		return false
+	case <-w.changed:
+	case <-t.C:
+	}
+	return true
+}
+
+func (w *fileWatcher) close() {
+	if w.notifier != nil {
+		w.notifier.close()
+	}
+}
@@ -0,0 +1,231 @@
+//go:build linux
+
+package monitors
+
+import (
+	"encoding/binary"
+	"os"
+	"path/filepath"
+	"strings"
+	"sync"
+	"syscall"
+)
+
+const (
+	// directory holding the followed file: appends, new files, renames in
+	inotifyLeafMask = syscall.IN_MODIFY | syscall.IN_CREATE | syscall.IN_MOVED_TO | syscall.IN_ONLYDIR
+	// directories above it: only new entries matter (next date/hour dir)
+	inotifyParentMask = syscall.IN_CREATE | syscall.IN_MOVED_TO | syscall.IN_ONLYDIR
+	// a single directory watched through watchDir: any entry created,
+	// renamed in, rewritten or chmodded
+	inotifyFlatMask = syscall.IN_CREATE | syscall.IN_MOVED_TO | syscall.IN_MODIFY | syscall.IN_ATTRIB | syscall.IN_ONLYDIR
+)
+
+// inotifyInstance is the process-wide inotify fd. Every tailed stream
+// subscribes to it, so the exporter holds one fd and one reader goroutine
+// however many logs it follows, and a burst across several logs is read
+// in one syscall.
+type inotifyInstance struct {
+	fd int // raw fd; f.Fd() would switch it back to blocking mode
+	f  *os.File
+
+	mu      sync.Mutex
+	watches map[int]*inotifyWatch // wd -> watch
+}
+
+// inotifyWatch is one watched directory and the notifiers that asked for
+// it. The kernel merges masks per directory (IN_MASK_ADD); the watch is
+// removed once its last subscriber lets go.
+type inotifyWatch struct {
+	dir  string
+	subs map[*inotifyNotifier]struct{}
+}
+
+var (
+	sharedInotifyOnce sync.Once
+	sharedInotify     *inotifyInstance
+	sharedInotifyErr  error
+)
+
+func getInotify() (*inotifyInstance, error) {
+	sharedInotifyOnce.Do(func() {
+		fd, err := syscall.InotifyInit1(syscall.IN_CLOEXEC | syscall.IN_NONBLOCK)
+		if err != nil {
+			sharedInotifyErr = err
+			return
+		}
+		// a non-blocking fd handed to os.NewFile is registered with the
+		// runtime poller, so Read parks the goroutine instead of a thread
+		sharedInotify = &inotifyInstance{
+			fd:      fd,
+			f:       os.NewFile(uintptr(fd), "inotify"),
+			watches: make(map[int]*inotifyWatch),
+		}
+		go sharedInotify.readEvents()
+	})
+	return sharedInotify, sharedInotifyErr
+}
+
+// inotifyNotifier is one fileWatcher's subscription to the shared
+// instance: the directory chain between its followed file and the log
+// root. inotify is not recursive, so a directory created under a watched
+// one (hl-node's next <date>/ dir) is added to the set as soon as its
+// IN_CREATE arrives; otherwise the first file written into it would go
+// unnoticed until the safety interval.
+type inotifyNotifier struct {
+	in       *inotifyInstance
+	onChange func()
+	wds      map[int]struct{} // guarded by in.mu
+	flat     bool             // set by watchDir: never follow new subdirectories; guarded by in.mu
+}
+
+func newNotifier(onChange func()) (notifier, error) {
+	in, err := getInotify()
+	if err != nil {
+		return nil, err
+	}
+	return &inotifyNotifier{
+		in:       in,
+		onChange: onChange,
+		wds:      make(map[int]struct{}),
+	}, nil
+}
+
+func (n *inotifyNotifier) watch(root, file string) error {
+	n.in.mu.Lock()
+	defer n.in.mu.Unlock()
+
+	n.in.unsubscribeLocked(n)
+	n.flat = false
+
+	root = filepath.Clean(root)
+	if file == "" {
+		return n.in.addLocked(n, root, inotifyLeafMask)
+	}
+
+	dir := filepath.Dir(file)
+	if err := n.in.addLocked(n, dir, inotifyLeafMask); err != nil {
+		return err
+	}
+	for dir != root && strings.HasPrefix(dir, root+string(filepath.Separator)) {
+		dir = filepath.Dir(dir)
+		if err := n.in.addLocked(n, dir, inotifyParentMask); err != nil {
+			return err
+		}
+	}
+	return nil
+}
+
+func (n *inotifyNotifier) watchDir(dir string) error {
+	n.in.mu.Lock()
+	defer n.in.mu.Unlock()
+
+	n.in.unsubscribeLocked(n)
+	n.flat = true
+	return n.in.addLocked(n, filepath.Clean(dir), inotifyFlatMask)
+}
+
+func (n *inotifyNotifier) close() error {
+	n.in.mu.Lock()
+	defer n.in.mu.Unlock()
+	n.in.unsubscribeLocked(n)
+	return nil
+}
+
+func (in *inotifyInstance) addLocked(n *inotifyNotifier, dir string, mask uint32) error {
+	wd, err := syscall.InotifyAddWatch(in.fd, dir, mask|syscall.IN_MASK_ADD)
+	if err != nil {
+		return err
+	}
+	w := in.watches[wd]
+	if w == nil {
+		w = &inotifyWatch{dir: dir, subs: make(map[*inotifyNotifier]struct{})}
+		in.watches[wd] = w
+	}
+	w.subs[n] = struct{}{}
+	n.wds[wd] = struct{}{}
+	return nil
+}
+
+func (in *inotifyInstance) unsubscribeLocked(n *inotifyNotifier) {
+	for wd := range n.wds {
+		delete(n.wds, wd)
+		w := in.watches[wd]
+		if w == nil {
+			continue
+		}
+		delete(w.subs, n)
+		if len(w.subs) == 0 {
+			syscall.InotifyRmWatch(in.fd, uint32(wd))
+			delete(in.watches, wd)
+		}
+	}
+}
+
+// readEvents drains the inotify fd for the life of the process. Every
+// batch produces one onChange call per affected notifier; new
+// subdirectories are watched (except for watchDir subscribers) before it
+// fires so the tail loop cannot race
+// a file created inside them.
+func (in *inotifyInstance) readEvents() {
+	buf := make([]byte, 16<<10)
+	for {
+		size, err := in.f.Read(buf)
+		if err != nil {
+			return
+		}
+
+		changed := make(map[*inotifyNotifier]struct{})
+		in.mu.Lock()
+		for off := 0; off+syscall.SizeofInotifyEvent <= size; {
+			wd := int(int32(binary.NativeEndian.Uint32(buf[off:])))
+			mask := binary.NativeEndian.Uint32(buf[off+4:])
+			nameLen := int(binary.NativeEndian.Uint32(buf[off+12:]))
+			nameStart := off + syscall.SizeofInotifyEvent
+			off = nameStart + nameLen
+			if off > size {
+				break
+			}
+
+			if mask&syscall.IN_Q_OVERFLOW != 0 {
+				// events were dropped: wake everyone to rescan
+				for _, w := range in.watches {
+					for n := range w.subs {
+						changed[n] = struct{}{}
+					}
+				}
+				continue
+			}
+			w := in.watches[wd]
+			if w == nil {
+				continue
+			}
+			for n := range w.subs {
+				changed[n] = struct{}{}
+			}
+			if mask&syscall.IN_IGNORED != 0 {
+				// directory removed; the kernel already dropped the watch
+				for n := range w.subs {
+					delete(n.wds, wd)
+				}
+				delete(in.watches, wd)
+				continue
+			}
+			if mask&syscall.IN_ISDIR == 0 || mask&(syscall.IN_CREATE|syscall.IN_MOVED_TO) == 0 || nameLen == 0 {
+				continue
+			}
+			name := strings.TrimRight(string(buf[nameStart:off]), "\x00")
+			newDir := filepath.Join(w.dir, name)
+			for n := range w.subs {
+				if !n.flat {
+					_ = in.addLocked(n, newDir, inotifyLeafMask)
+				}
+			}
+		}
+		in.mu.Unlock()
+
+		for n := range changed {
+			n.onChange()
+		}
+	}
+}
@@ -0,0 +1,55 @@
+//go:build linux
+
+package monitors
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+)
+
+func TestInotifyWatchDirDoesNotFollowSubdirs(t *testing.T) {
+	home := t.TempDir()
+	changed := make(chan struct{}, 16)
+	n, err := newNotifier(func() { changed <- struct{}{} })
+	if err != nil {
+		t.Skipf("inotify unavailable: %v", err)
+	}
+	defer n.close()
+	in := n.(*inotifyNotifier)
+	if err := in.watchDir(home); err != nil {
+		t.Fatal(err)
+	}
+
+	waitChange := func() {
+		t.Helper()
+		select {
+		case <-changed:
+		case <-time.After(2 * time.Second):
+			t.Fatal("no change notification")
+		}
+	}
+	for _, dir := range []string{"hl", filepath.Join("hl", "data"), filepath.Join("hl", "data", "20260525")} {
+		if err := os.Mkdir(filepath.Join(home, dir), 0o755); err != nil {
+			t.Fatal(err)
+		}
+	}
+	waitChange()
+	for len(changed) > 0 {
+		<-changed
+	}
+
+	// the binary being replaced must still wake the watcher
+	if err := os.WriteFile(filepath.Join(home, "hl-node"), []byte("x"), 0o755); err != nil {
+		t.Fatal(err)
+	}
+	waitChange()
+
+	in.in.mu.Lock()
+	got := len(in.wds)
+	in.in.mu.Unlock()
+	if got != 1 {
+		t.Fatalf("watchDir holds %d watches, want 1", got)
+	}
+}
@@ -0,0 +1,12 @@
+//go:build !linux
+
+package monitors
+
+import "errors"
+
+// inotify is Linux-only. Elsewhere fileWatcher falls back to polling
+// every tailPollInterval.
+
+func newNotifier(onChange func()) (notifier, error) {
+	return nil, errors.New("file change notifications are only implemented on linux")
+}
@@ -115,6 +115,7 @@ func readGossipConnectionEvents(path string, offset int64) (int64, int, error) {
 	if _, err := f.Seek(offset, io.SeekStart); err != nil {
 		return offset, 0, err
 	}
+	adviseSequential(f)
 	reader := bufio.NewReaderSize(f, 1<<20)
 	processed := 0
 	for {
@@ -0,0 +1,228 @@
+package monitors
+
+import (
+	"bytes"
+	"context"
+	"errors"
+	"fmt"
+	"io"
+	"os"
+	"time"
+
+	"github.com/validaoxyz/hyperliquid-exporter/internal/logger"
+	"github.com/validaoxyz/hyperliquid-exporter/internal/utils"
+)
+
+// tailReadSize is the initial read buffer size. It is large enough that a
+// rotation burst on a busy node is read in a handful of syscalls; the
+// buffer grows to fit the longest line seen (replica_cmds lines hold whole
+// blocks) and is reused for the life of the tailer.
+const tailReadSize = 1 << 20
+
+// logTailer follows the newest file under root the way `tail -F` would:
+// it starts at EOF of whatever file is current at startup, reads every
+// file that appears after that from the beginning, and hands each line to
+// handle. Between reads it parks on a fileWatcher instead of sleeping, so
+// an idle node costs no wake-ups and a new line is seen within
+// milliseconds of being written.
+//
+// Each wake-up reads everything appended since the last one in a few
+// large reads and splits it on '\n'; a trailing partial line stays in
+// the buffer until the rest of it is written.
+//
+// Rotation is only looked for when a directory under root has changed:
+// hl-node rotates by creating a new file (and a new directory at date
+// boundaries), which always bumps the mtime of the directory it lands in.
+// Every directory the last GetLatestFile lookup walked is checked, not
+// just the followed file's, so a file that shows up late in a new date
+// directory is still seen. Most wake-ups are appends and cost one stat per
+// directory instead of a GetLatestFile call. A file replaced under the same path is caught by
+// comparing it with the open one via os.SameFile.
+//
+// Used by the block-time, proposal and consensus/status streams, which
+// all share this rotation scheme. Lines are passed as raw bytes without
+// the newline so the JSON parsers can decode them without a string
+// round-trip; the slice is only valid until handle returns. A logTailer
+// is single-use.
+type logTailer struct {
+	component    string // logger component
+	name         string // stream name used in log and error messages
+	root         string
+	forcePolling bool
+
+	currentFile string
+	file        *os.File
+	fileInfo    os.FileInfo          // of file, for os.SameFile
+	dirs        map[string]time.Time // every directory under root at the last check; nil forces one
+	buf         []byte               // unconsumed bytes: the partial last line
+	scanned     int                  // prefix of buf known to hold no '\n'
+}
+
+func (t *logTailer) run(ctx context.Context, errCh chan<- error, handle func(line []byte)) {
+	w := newFileWatcher(t.component, t.forcePolling)
+	defer w.close()
+	defer t.closeFile()
+	w.watch(t.root, "")
+
+	for {
+		if t.file == nil || !t.dirsUnchanged() {
+			t.checkRotation(errCh, handle, w)
+		}
+
+		if t.file != nil {
+			if err := t.drain(handle); err != nil {
+				errCh <- fmt.Errorf("error reading from %s file: %w", t.name, err)
+			}
+		}
+
+		if !w.wait(ctx) {
+			return
+		}
+	}
+}
+
+// checkRotation switches to the newest file under root if it is not the
+// one being read, then records the directory mtimes the next check is
+// gated on.
+func (t *logTailer) checkRotation(errCh chan<- error, handle func(line []byte), w *fileWatcher) {
+	latestFile, dirs, err := utils.GetLatestFileDirs(t.root)
+	if err != nil {
+		if !errors.Is(err, os.ErrNotExist) {
+			errCh <- fmt.Errorf("error finding latest %s file: %w", t.name, err)
+		}
+		t.dirs = nil
+		return
+	}
+	if latestFile != "" && (latestFile != t.currentFile || t.replaced()) {
+		// finish the old file first: lines written just before the
+		// rotation would otherwise be lost
+		if t.file != nil {
+			if err := t.drain(handle); err != nil {
+				errCh <- fmt.Errorf("error reading from %s file: %w", t.name, err)
+			}
+			if len(t.buf) > 0 {
+				handle(t.buf)
+				t.buf, t.scanned = t.buf[:0], 0
+			}
+		}
+		if err := t.open(latestFile); err != nil {
+			errCh <- err
+		} else {
+			w.watch(t.root, latestFile)
+		}
+	}
+	t.dirs = dirs
+	if t.file == nil {
+		t.dirs = nil
+	}
+}
+
+// replaced reports whether the open file's path now names a different
+// file (rotated by rename onto the same name).
+func (t *logTailer) replaced() bool {
+	if t.fileInfo == nil {
+		return false
+	}
+	info, err := os.Stat(t.currentFile)
+	return err == nil && !os.SameFile(info, t.fileInfo)
+}
+
+func (t *logTailer) dirsUnchanged() bool {
+	if len(t.dirs) == 0 {
+		return false
+	}
+	for dir, modTime := range t.dirs {
+		info, err := os.Lstat(dir)
+		if err != nil || !info.ModTime().Equal(modTime) {
+			return false
+		}
+	}
+	return true
+}
+
+// drain reads the current file to EOF and calls handle for every complete
+// line in it.
+func (t *logTailer) drain(handle func(line []byte)) error {
+	if t.buf == nil {
+		t.buf = make([]byte, 0, tailReadSize)
+	}
+	for {
+		if len(t.buf) == cap(t.buf) {
+			grown := make([]byte, len(t.buf), 2*cap(t.buf))
+			copy(grown, t.buf)
+			t.buf = grown
+		}
+		n, err := t.file.Read(t.buf[len(t.buf):cap(t.buf)])
+		if n > 0 {
+			t.buf = t.buf[:len(t.buf)+n]
+			t.consume(handle)
+		}
+		if err == io.EOF {
+			return nil
+		}
+		if err != nil {
+			return err
+		}
+	}
+}
+
+// consume hands every complete line in buf to handle and moves the
+// remaining partial line to the front of buf.
+func (t *logTailer) consume(handle func(line []byte)) {
+	start := 0
+	for {
+		i := bytes.IndexByte(t.buf[t.scanned:], '\n')
+		if i < 0 {
+			break
+		}
+		end := t.scanned + i
+		handle(t.buf[start:end])
+		start = end + 1
+		t.scanned = start
+	}
+	if start > 0 {
+		t.buf = t.buf[:copy(t.buf, t.buf[start:])]
+	}
+	t.scanned = len(t.buf)
+}
+
+// open switches the tailer to path. The first file opened is read from
+// EOF so a restart doesn't replay history; later ones are read in full.
+func (t *logTailer) open(path string) error {
+	f, err := os.Open(path)
+	if err != nil {
+		return fmt.Errorf("error opening %s file: %w", t.name, err)
+	}
+	adviseSequential(f)
+	if t.currentFile == "" {
+		if _, err := f.Seek(0, io.SeekEnd); err != nil {
+			f.Close()
+			return fmt.Errorf("error seeking to end of %s file: %w", t.name, err)
+		}
+		logger.InfoComponent(t.component, "First run: starting to stream %s from the end of file %s", t.name, path)
+	} else {
+		logger.InfoComponent(t.component, "Switching to new %s file: %s", t.name, path)
+	}
+
+	info, err := f.Stat()
+	if err != nil {
+		f.Close()
+		return fmt.Errorf("error reading %s file info: %w", t.name, err)
+	}
+
+	t.closeFile()
+	t.file = f
+	t.fileInfo = info
+	t.buf = t.buf[:0]
+	t.scanned = 0
+	t.currentFile = path
+	return nil
+}
+
+func (t *logTailer) closeFile() {
+	if t.file != nil {
+		t.file.Close()
+		t.file = nil
+		t.fileInfo = nil
+	}
+}
@@ -0,0 +1,194 @@
+package monitors
+
+import (
+	"os"
+	"path/filepath"
+	"strings"
+	"testing"
+	"time"
+)
+
+func TestLogTailerDrainKeepsPartialLine(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "0")
+	w, err := os.Create(path)
+	if err != nil {
+		t.Fatal(err)
+	}
+	defer w.Close()
+	r, err := os.Open(path)
+	if err != nil {
+		t.Fatal(err)
+	}
+	tl := &logTailer{name: "test", file: r}
+	defer tl.closeFile()
+
+	var got []string
+	handle := func(line []byte) { got = append(got, string(line)) }
+	drain := func(data string) {
+		t.Helper()
+		if _, err := w.WriteString(data); err != nil {
+			t.Fatal(err)
+		}
+		if err := tl.drain(handle); err != nil {
+			t.Fatal(err)
+		}
+	}
+
+	drain("{\"a\":1}\n{\"b\":")
+	drain("2}\n\n{\"c\"")
+	drain(":3}\n")
+	want := []string{`{"a":1}`, `{"b":2}`, ``, `{"c":3}`}
+	if strings.Join(got, "|") != strings.Join(want, "|") {
+		t.Fatalf("got %q, want %q", got, want)
+	}
+	if len(tl.buf) != 0 {
+		t.Errorf("leftover %q after complete line", tl.buf)
+	}
+}
+
+func TestLogTailerDrainLongLine(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "0")
+	long := strings.Repeat("x", 3*tailReadSize+17)
+	if err := os.WriteFile(path, []byte("a\n"+long+"\nb"), 0o644); err != nil {
+		t.Fatal(err)
+	}
+	r, err := os.Open(path)
+	if err != nil {
+		t.Fatal(err)
+	}
+	tl := &logTailer{name: "test", file: r}
+	defer tl.closeFile()
+
+	var got []string
+	if err := tl.drain(func(line []byte) { got = append(got, string(line)) }); err != nil {
+		t.Fatal(err)
+	}
+	if len(got) != 2 || got[0] != "a" || got[1] != long {
+		t.Fatalf("got %d lines, want a and the %d-byte line", len(got), len(long))
+	}
+	if string(tl.buf) != "b" {
+		t.Errorf("leftover = %q, want %q", tl.buf, "b")
+	}
+}
+
+func TestLogTailerRotationGate(t *testing.T) {
+	root := t.TempDir()
+	dir := filepath.Join(root, "20260101")
+	if err := os.Mkdir(dir, 0o755); err != nil {
+		t.Fatal(err)
+	}
+	path := filepath.Join(dir, "0")
+	if err := os.WriteFile(path, []byte("a\n"), 0o644); err != nil {
+		t.Fatal(err)
+	}
+	ageDirs(t, dir, root)
+
+	tl := &logTailer{name: "test", root: root}
+	defer tl.closeFile()
+	errCh := make(chan error, 4)
+	tl.checkRotation(errCh, func([]byte) {}, &fileWatcher{})
+	if tl.currentFile != path {
+		t.Fatalf("following %q, want %q", tl.currentFile, path)
+	}
+	if len(tl.dirs) != 2 || !tl.dirsUnchanged() {
+		t.Fatalf("dirs = %v, want both directories stamped and unchanged", tl.dirs)
+	}
+
+	// appending leaves the gate closed
+	if err := os.WriteFile(path, []byte("a\nb\n"), 0o644); err != nil {
+		t.Fatal(err)
+	}
+	if !tl.dirsUnchanged() || tl.replaced() {
+		t.Fatal("append reported as rotation")
+	}
+
+	// a file renamed over the same path opens it again
+	tmp := filepath.Join(dir, "0.new")
+	if err := os.WriteFile(tmp, nil, 0o644); err != nil {
+		t.Fatal(err)
+	}
+	if err := os.Rename(tmp, path); err != nil {
+		t.Fatal(err)
+	}
+	if tl.dirsUnchanged() {
+		t.Error("rename did not open the gate")
+	}
+	if !tl.replaced() {
+		t.Error("replaced file not detected")
+	}
+
+	// directories modified just now are not trusted
+	tl.checkRotation(errCh, func([]byte) {}, &fileWatcher{})
+	if tl.dirs != nil {
+		t.Errorf("dirs = %v, want nil within the racy window", tl.dirs)
+	}
+}
+
+func TestLogTailerRotationIntoNewDirWithLateFile(t *testing.T) {
+	root := t.TempDir()
+	oldDir := filepath.Join(root, "20260101")
+	if err := os.Mkdir(oldDir, 0o755); err != nil {
+		t.Fatal(err)
+	}
+	oldPath := filepath.Join(oldDir, "0")
+	if err := os.WriteFile(oldPath, []byte("a\n"), 0o644); err != nil {
+		t.Fatal(err)
+	}
+	ageDirs(t, oldDir, root)
+
+	tl := &logTailer{name: "test", root: root}
+	defer tl.closeFile()
+	errCh := make(chan error, 4)
+	var got []string
+	handle := func(line []byte) { got = append(got, string(line)) }
+	tl.checkRotation(errCh, handle, &fileWatcher{})
+
+	// the next date directory appears, but its first file only well after
+	// the directory's mtime has settled
+	newDir := filepath.Join(root, "20260102")
+	if err := os.Mkdir(newDir, 0o755); err != nil {
+		t.Fatal(err)
+	}
+	ageDirs(t, newDir, root)
+	if tl.dirsUnchanged() {
+		t.Fatal("new directory did not open the gate")
+	}
+	tl.checkRotation(errCh, handle, &fileWatcher{})
+	if tl.currentFile != oldPath || !tl.dirsUnchanged() {
+		t.Fatalf("following %q with dirs %v, want %q behind a closed gate", tl.currentFile, tl.dirs, oldPath)
+	}
+
+	newPath := filepath.Join(newDir, "0")
+	if err := os.WriteFile(newPath, []byte("b\n"), 0o644); err != nil {
+		t.Fatal(err)
+	}
+	if tl.dirsUnchanged() {
+		t.Fatal("file in the new directory did not open the gate")
+	}
+	tl.checkRotation(errCh, handle, &fileWatcher{})
+	if tl.currentFile != newPath {
+		t.Fatalf("following %q, want %q", tl.currentFile, newPath)
+	}
+	if err := tl.drain(handle); err != nil {
+		t.Fatal(err)
+	}
+	if len(got) != 1 || got[0] != "b" {
+		t.Errorf("lines = %q, want [b]", got)
+	}
+	select {
+	case err := <-errCh:
+		t.Errorf("unexpected error: %v", err)
+	default:
+	}
+}
+
+// ageDirs backdates dirs past the racy window so they gate rotation.
+func ageDirs(t *testing.T, dirs ...string) {
+	t.Helper()
+	old := time.Now().Add(-time.Hour)
+	for _, d := range dirs {
+		if err := os.Chtimes(d, old, old); err != nil {
+			t.Fatal(err)
+		}
+	}
+}
@@ -4,6 +4,8 @@ import (
 	"bytes"
 	"context"
 	"fmt"
+	"io"
+	"net/http"
 	"os"
 	"os/exec"
 	"strings"
@@ -14,20 +16,30 @@ import (
 	"github.com/validaoxyz/hyperliquid-exporter/internal/metrics"
 )
 
-const (
-	downloadInterval = 30 * time.Minute
-)
+// binaryDownloadTimeout bounds one hl-visor download; the binary is large,
+// so this is well past the timeouts used for API calls.
+const binaryDownloadTimeout = 5 * time.Minute
 
 var (
-	lastDownloadTime time.Time
 	cachedLatestHash string
-	cacheExpiry      time.Time
+
+	// validators of the hl-visor build cachedLatestHash was read from; sent
+	// back as If-None-Match / If-Modified-Since so an unchanged binary
+	// costs one bodiless 304 instead of a download and an exec
+	latestBinaryETag         string
+	latestBinaryLastModified string
+
+	updateHTTPClient = &http.Client{Timeout: binaryDownloadTimeout}
 )
 
 func StartUpdateChecker(ctx context.Context, cfg config.Config, errCh chan<- error) {
 	goSafe("update_checker", func() {
 		// wait a bit for version monitor to run first
-		time.Sleep(2 * time.Second)
+		select {
+		case <-ctx.Done():
+			return
+		case <-time.After(2 * time.Second):
+		}
 
 		// run immediately on startup
 		if err := checkSoftwareUpdate(ctx, cfg); err != nil {
@@ -51,12 +63,6 @@ func StartUpdateChecker(ctx context.Context, cfg config.Config, errCh chan<- err
 }
 
 func checkSoftwareUpdate(ctx context.Context, cfg config.Config) error {
-	// use cached value if still valid
-	if time.Now().Before(cacheExpiry) && cachedLatestHash != "" {
-		updateUpToDateStatus()
-		return nil
-	}
-
 	// determine binary URL based on chain
 	var binaryURL string
 	if cfg.Chain == "mainnet" {
@@ -65,20 +71,56 @@ func checkSoftwareUpdate(ctx context.Context, cfg config.Config) error {
 		binaryURL = "https://binaries.hyperliquid-testnet.xyz/Testnet/hl-visor"
 	}
 
+	req, err := http.NewRequestWithContext(ctx, http.MethodGet, binaryURL, nil)
+	if err != nil {
+		return fmt.Errorf("error creating download request: %w", err)
+	}
+	if cachedLatestHash != "" {
+		if latestBinaryETag != "" {
+			req.Header.Set("If-None-Match", latestBinaryETag)
+		}
+		if latestBinaryLastModified != "" {
+			req.Header.Set("If-Modified-Since", latestBinaryLastModified)
+		}
+	}
+
+	resp, err := updateHTTPClient.Do(req)
+	if err != nil {
+		return fmt.Errorf("error downloading latest binary: %w", err)
+	}
+	defer resp.Body.Close()
+
+	if resp.StatusCode == http.StatusNotModified {
+		updateUpToDateStatus()
+		return nil
+	}
+	if resp.StatusCode != http.StatusOK {
+		return fmt.Errorf("error downloading latest binary: status %d", resp.StatusCode)
+	}
+	// servers that ignore conditional requests still send the validator;
+	// stop before reading the body if it is the build we already know
+	etag, lastModified := resp.Header.Get("ETag"), resp.Header.Get("Last-Modified")
+	if cachedLatestHash != "" && etag != "" && etag == latestBinaryETag {
+		updateUpToDateStatus()
+		return nil
+	}
+
 	// create temporary file for download
 	tmpFile, err := os.CreateTemp("", "hl-visor-*.tmp")
 	if err != nil {
 		return fmt.Errorf("error creating temp file: %w", err)
 	}
 	tmpPath := tmpFile.Name()
-	tmpFile.Close()
 
 	// ensure cleanup
 	defer os.Remove(tmpPath)
 
-	// download binary to temp file
-	downloadCmd := exec.CommandContext(ctx, "curl", "-sSL", "-o", tmpPath, binaryURL)
-	if err := downloadCmd.Run(); err != nil {
+	// stream the binary straight into the temp file
+	_, err = io.Copy(tmpFile, resp.Body)
+	if closeErr := tmpFile.Close(); err == nil {
+		err = closeErr
+	}
+	if err != nil {
 		return fmt.Errorf("error downloading latest binary: %w", err)
 	}
 
@@ -102,7 +144,8 @@ func checkSoftwareUpdate(ctx context.Context, cfg config.Config) error {
 		latestCommitParts := strings.Split(commitLine, " ")
 		if len(latestCommitParts) >= 2 {
 			cachedLatestHash = strings.TrimSpace(latestCommitParts[1])
-			cacheExpiry = time.Now().Add(downloadInterval)
+			latestBinaryETag = etag
+			latestBinaryLastModified = lastModified
 
 			updateUpToDateStatus()
 			return nil
@@ -7,6 +7,7 @@ import (
 	"io"
 	"os"
 	"os/exec"
+	"path/filepath"
 	"strings"
 	"time"
 
@@ -35,29 +36,72 @@ func NodeBinaryReady(cfg config.Config) (string, error) {
 	return cfg.NodeBinary, nil
 }
 
+// versionSettleDelay is how long a changed hl-node binary must stay
+// unchanged before it is exec'd, so a binary still being written by
+// hl-visor isn't run half-copied.
+const versionSettleDelay = 2 * time.Second
+
+// versionRetryInterval paces retries after a failed version probe; a
+// successful probe is only repeated when the binary changes.
+const versionRetryInterval = 30 * time.Minute
+
 func StartVersionMonitor(ctx context.Context, cfg config.Config, errCh chan<- error) {
 	goSafe("version", func() {
+		// the binary only changes on upgrade, so instead of re-running it on
+		// a timer watch its directory and re-run when a different file (or
+		// a rewritten one) sits at the path. The directory is usually $HOME,
+		// so watch it flat: following its subdirectories would pull in ~/hl
+		w := newFileWatcher("system", cfg.ForcePolling)
+		defer w.close()
+		w.watchDir(filepath.Dir(cfg.NodeBinary))
+
 		// run immediately on startup
+		probed, _ := os.Stat(cfg.NodeBinary)
+		lastRun := time.Now()
+		failed := false
 		if err := updateVersionInfo(ctx, cfg); err != nil {
 			errCh <- fmt.Errorf("version monitor error: %w", err)
+			failed = true
 		}
 
-		ticker := time.NewTicker(30 * time.Minute)
-		defer ticker.Stop()
-
-		for {
-			select {
-			case <-ctx.Done():
-				return
-			case <-ticker.C:
-				if err := updateVersionInfo(ctx, cfg); err != nil {
-					errCh <- fmt.Errorf("version monitor error: %w", err)
+		var pending os.FileInfo
+		var pendingSince time.Time
+		for w.wait(ctx) {
+			info, err := os.Stat(cfg.NodeBinary)
+			if err != nil {
+				// mid-replace; try again on the next event
+				continue
+			}
+			if !binaryChanged(probed, info) {
+				pending = nil
+				if !failed || time.Since(lastRun) < versionRetryInterval {
+					continue
 				}
+			} else if pending == nil || binaryChanged(pending, info) {
+				pending, pendingSince = info, time.Now()
+				continue
+			} else if time.Since(pendingSince) < versionSettleDelay {
+				continue
+			}
+
+			logger.DebugComponent("system", "hl-node binary changed, re-reading version")
+			probed, pending = info, nil
+			lastRun = time.Now()
+			failed = false
+			if err := updateVersionInfo(ctx, cfg); err != nil {
+				errCh <- fmt.Errorf("version monitor error: %w", err)
+				failed = true
 			}
 		}
 	})
 }
 
+// binaryChanged reports whether cur is a different file from prev, or the
+// same file rewritten.
+func binaryChanged(prev, cur os.FileInfo) bool {
+	return prev == nil || !os.SameFile(prev, cur) || !prev.ModTime().Equal(cur.ModTime()) || prev.Size() != cur.Size()
+}
+
 func updateVersionInfo(ctx context.Context, cfg config.Config) error {
 	// create a temporary file for the binary copy
 	tmpFile, err := os.CreateTemp("", "hl_node_*.tmp")
@@ -1,31 +1,112 @@
 package utils
 
 import (
+	"io/fs"
 	"os"
 	"path/filepath"
+	"sync"
 	"time"
 )
 
-// returns the path to the latest modified file in the directory
+// racyDirWindow: directory mtimes come from the kernel's coarse clock, so
+// two entry changes a few ms apart can leave the same mtime behind. A walk
+// that sees a directory modified this recently is not cached, otherwise a
+// file created right after it could stay invisible until the next change.
+const racyDirWindow = 2 * time.Second
+
+// latestFileEntry is the memoized result of one GetLatestFile walk. dirs
+// records the mtime of every directory visited: adding, removing or
+// renaming an entry bumps its parent's mtime, so while none of them moved
+// the newest file is still the same one (hl-node only appends to it).
+type latestFileEntry struct {
+	latest string
+	dirs   map[string]time.Time
+}
+
+var (
+	latestFileMu    sync.Mutex
+	latestFileCache = make(map[string]*latestFileEntry)
+)
+
+// returns the path to the latest modified file in the directory.
+// Repeat calls re-stat only the directories of the tree, not every file,
+// until one of them changes.
 func GetLatestFile(directory string) (string, error) {
-	var latestFile string
+	latest, _, err := GetLatestFileDirs(directory)
+	return latest, err
+}
+
+// GetLatestFileDirs is GetLatestFile that also returns the mtime of every
+// directory in the tree the answer was read from: while none of them has
+// moved, the answer still holds. dirs is nil when one of them changed too
+// recently to be trusted. The map is shared and must not be modified.
+func GetLatestFileDirs(directory string) (latest string, dirs map[string]time.Time, err error) {
+	latestFileMu.Lock()
+	cached := latestFileCache[directory]
+	latestFileMu.Unlock()
+	if cached != nil && cached.fresh() {
+		return cached.latest, cached.dirs, nil
+	}
+
+	entry, cacheable, err := walkLatestFile(directory)
+
+	latestFileMu.Lock()
+	if err != nil || !cacheable {
+		delete(latestFileCache, directory)
+	} else {
+		latestFileCache[directory] = entry
+	}
+	latestFileMu.Unlock()
+
+	if err != nil {
+		return "", nil, err
+	}
+	if !cacheable {
+		return entry.latest, nil, nil
+	}
+	return entry.latest, entry.dirs, nil
+}
+
+func (e *latestFileEntry) fresh() bool {
+	for dir, modTime := range e.dirs {
+		info, err := os.Lstat(dir)
+		if err != nil || !info.ModTime().Equal(modTime) {
+			return false
+		}
+	}
+	return true
+}
+
+func walkLatestFile(directory string) (*latestFileEntry, bool, error) {
+	entry := &latestFileEntry{dirs: make(map[string]time.Time)}
 	var latestModTime time.Time
+	cacheable := true
+	start := time.Now()
 
-	err := filepath.Walk(directory, func(path string, info os.FileInfo, err error) error {
+	err := filepath.WalkDir(directory, func(path string, d fs.DirEntry, err error) error {
+		if err != nil {
+			return err
+		}
+		info, err := d.Info()
 		if err != nil {
 			return err
 		}
-		if !info.IsDir() {
-			if info.ModTime().After(latestModTime) {
-				latestModTime = info.ModTime()
-				latestFile = path
+		if d.IsDir() {
+			entry.dirs[path] = info.ModTime()
+			if start.Sub(info.ModTime()) < racyDirWindow {
+				cacheable = false
 			}
+			return nil
+		}
+		if info.ModTime().After(latestModTime) {
+			latestModTime = info.ModTime()
+			entry.latest = path
 		}
 		return nil
 	})
 
 	if err != nil {
-		return "", err
+		return nil, false, err
 	}
-	return latestFile, nil
+	return entry, cacheable, nil
 }
@@ -0,0 +1,59 @@
+package utils
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+)
+
+func TestGetLatestFileTracksNewFilesInNestedDirs(t *testing.T) {
+	root := t.TempDir()
+	day := filepath.Join(root, "20260101")
+	if err := os.Mkdir(day, 0o755); err != nil {
+		t.Fatal(err)
+	}
+	old := filepath.Join(day, "0")
+	if err := os.WriteFile(old, []byte("x\n"), 0o644); err != nil {
+		t.Fatal(err)
+	}
+	// age the tree past the racy window so the first result is cached
+	past := time.Now().Add(-time.Hour)
+	for _, p := range []string{old, day, root} {
+		if err := os.Chtimes(p, past, past); err != nil {
+			t.Fatal(err)
+		}
+	}
+
+	for i := 0; i < 2; i++ {
+		got, err := GetLatestFile(root)
+		if err != nil {
+			t.Fatal(err)
+		}
+		if got != old {
+			t.Fatalf("call %d: got %q, want %q", i, got, old)
+		}
+	}
+
+	// next hour's file in a new date dir only bumps root's mtime
+	next := filepath.Join(root, "20260102", "1")
+	if err := os.Mkdir(filepath.Dir(next), 0o755); err != nil {
+		t.Fatal(err)
+	}
+	if err := os.WriteFile(next, []byte("y\n"), 0o644); err != nil {
+		t.Fatal(err)
+	}
+	got, err := GetLatestFile(root)
+	if err != nil {
+		t.Fatal(err)
+	}
+	if got != next {
+		t.Fatalf("after rotation: got %q, want %q", got, next)
+	}
+}
+
+func TestGetLatestFileMissingDir(t *testing.T) {
+	if _, err := GetLatestFile(filepath.Join(t.TempDir(), "missing")); !os.IsNotExist(err) {
+		t.Fatalf("got %v, want not-exist error", err)
+	}
+}